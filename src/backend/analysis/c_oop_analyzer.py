@@ -1,4 +1,6 @@
 # copied imports from c++ code
+import logging
+import os
 import re
 import zipfile
 from collections import defaultdict
@@ -22,6 +24,11 @@ except ImportError:
     MetadataExtractor = None
     FileClassifier = None
 
+logger = logging.getLogger(__name__)
+
+# File suffixes treated as C sources when scanning a project
+C_SOURCE_EXTENSIONS = (".c", ".h")
+
 
 @dataclass
 class COOPAnalysis:
@@ -191,7 +198,6 @@ class COOPAnalyzer:
             return self.analysis
 
         try:
-            import os
             import tempfile
 
             # file extension based on filename
@@ -232,7 +238,7 @@ class COOPAnalyzer:
                                 ]
                             ):
                                 continue
-                        print(f"Parse error: {diag.spelling}")
+                        logger.warning("Parse error in %s: %s", filename, diag.spelling)
 
             # Traverse the Abstract Syntax Tree
             self._traverse_ast(translation_unit.cursor, filename)
@@ -241,10 +247,7 @@ class COOPAnalyzer:
             os.unlink(temp_path)
 
         except Exception as e:
-            print(f"Warning: Failed to parse C file: {e}")
-            import traceback
-
-            traceback.print_exc()
+            logger.warning("Failed to parse C file %s: %s", filename, e, exc_info=True)
 
         return self.analysis
 
@@ -881,7 +884,7 @@ def analyze_c_project(zip_path: Path, project_path: str = "") -> Dict:
                 project_path = getattr(metadata_obj, "project_path", project_path)
                 metadata_dict = metadata_obj.to_dict()
         except Exception as e:
-            print(f"Warning: MetadataExtractor failed: {e}")
+            logger.warning("MetadataExtractor failed: %s", e)
 
     analyzer = COOPAnalyzer()
 
@@ -910,14 +913,14 @@ def analyze_c_project(zip_path: Path, project_path: str = "") -> Dict:
                             if isinstance(value, list):
                                 for item in value:
                                     if isinstance(item, str):
-                                        if item.endswith((".c", ".h")):
+                                        if item.endswith(C_SOURCE_EXTENSIONS):
                                             code_paths.append(item)
                                     elif isinstance(item, dict):
                                         path = item.get("path") or item.get("relative_path") or item.get("file_path")
-                                        if isinstance(path, str) and path.endswith((".c", ".h")):
+                                        if isinstance(path, str) and path.endswith(C_SOURCE_EXTENSIONS):
                                             code_paths.append(path)
                 except Exception as e:
-                    print(f"Warning: FileClassifier failed: {e}")
+                    logger.warning("FileClassifier failed: %s", e)
                 finally:
                     if classifier is not None and hasattr(classifier, "close"):
                         try:
@@ -926,47 +929,52 @@ def analyze_c_project(zip_path: Path, project_path: str = "") -> Dict:
                             pass
 
             if not code_paths:
-                for name in zf.namelist():
-                    if name.endswith(".c") or name.endswith(".h"):
-                        code_paths.append(name)
+                code_paths = [name for name in zf.namelist() if name.endswith(C_SOURCE_EXTENSIONS)]
 
             # deduplicate & sort
             code_paths = sorted(set(code_paths))
 
-            # Extract all C/H files to temp directory first
+            # Only headers need to exist on disk so libclang can resolve #include
+            # directives; source files are analyzed straight from the archive.
+            # Every source file's directory is still created, because includes such
+            # as "../inc/shape.h" are resolved through it.
             for rel_path in code_paths:
                 try:
-                    # Extract file preserving structure
-                    target_path = Path(temp_dir) / rel_path
-                    target_path.parent.mkdir(parents=True, exist_ok=True)
+                    # Extract header preserving structure
+                    target_path = os.path.join(temp_dir, rel_path)
+                    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                    if not rel_path.endswith(".h"):
+                        continue
 
                     content = zf.read(rel_path).decode("utf-8", errors="ignore")
-                    target_path.write_text(content)
+                    with open(target_path, "w") as f:
+                        f.write(content)
                 except Exception as e:
-                    print(f"Warning: Failed to extract {rel_path}: {e}")
+                    logger.warning("Failed to extract %s: %s", rel_path, e)
                     continue
 
-        # Now analyze each file with include paths
-        for rel_path in code_paths:
-            try:
-                target_path = Path(temp_dir) / rel_path
-                if not target_path.exists():
+            # Read, analyze and discard each file in one pass
+            for rel_path in code_paths:
+                try:
+                    content = zf.read(rel_path).decode("utf-8", errors="ignore")
+                except Exception as e:
+                    logger.warning("Failed to extract %s: %s", rel_path, e)
                     continue
 
-                content = target_path.read_text()
-                filename = Path(rel_path).name
+                try:
+                    filename = os.path.basename(rel_path)
 
-                # Get all directories that might contain headers
-                include_dirs = [
-                    temp_dir,  # Root directory
-                    str(target_path.parent),  # File's own directory
-                ]
+                    # Get all directories that might contain headers
+                    include_dirs = [
+                        temp_dir,  # Root directory
+                        os.path.dirname(os.path.join(temp_dir, rel_path)),  # File's own directory
+                    ]
 
-                analyzer.analyze_file(content, filename, include_dirs)
+                    analyzer.analyze_file(content, filename, include_dirs)
 
-            except Exception as e:
-                print(f"Warning: Failed to analyze {rel_path}: {e}")
-                continue
+                except Exception as e:
+                    logger.warning("Failed to analyze %s: %s", rel_path, e)
+                    continue
 
         # Run post-processing after all files are analyzed
         analyzer.finalize_analysis()
@@ -17,13 +17,79 @@ Supports:
 """
 
 import ast
+import hashlib
+import logging
 import re
+import sys
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# slots=True drops the per-instance __dict__ but is only available on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Memoized per-file (insights, counts) keyed by (file_path, source digest, collect_details),
+# least recently used first
+_INSIGHT_CACHE_SIZE = 4096
+_INSIGHT_CACHE: "OrderedDict[Tuple[str, bytes, bool], Tuple[Tuple[ComplexityInsight, ...], Dict[str, int]]]" = OrderedDict()
+# The API analyzes projects on several threads; reordering and eviction must not interleave
+_INSIGHT_CACHE_LOCK = threading.Lock()
+
+# Stack markers closing a loop / nested scope during ComplexityAnalyzer's iterative traversal
+_LEAVE_LOOP = object()
+_LEAVE_SCOPE = object()
+
+# Nodes whose bodies are not executed as part of an enclosing loop
+_SCOPE_TYPES = frozenset({ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef})
+
+# (complexity_type, points per finding, maximum deduction) for score penalties
+_PENALTIES = (
+    ("nested_loops", 10, 30),
+    ("inefficient_lookup", 8, 25),
+    ("inefficient_membership_test", 5, 15),
+    ("inefficient_string_concat", 5, 15),
+)
+
+# Uncached files needed before analyze_python_project uses a process pool
+_PARALLEL_MIN_FILES = 16
+_PARALLEL_CHUNKSIZE = 8
+
+# Decorator names treated as memoization
+_MEMO_DECORATORS = frozenset({"lru_cache", "cache", "memoize", "cached", "cached_property"})
+
+# Complexity types that count as good practices in reports
+_GOOD_PRACTICE_TYPES = frozenset(
+    {
+        # Python patterns
+        "efficient_data_structure",
+        "sorting_with_key",
+        "set_operations",
+        "dict_lookup",
+        "list_comprehension",
+        "generator_expression",
+        "binary_search",
+        "memoization",
+        # Java patterns
+        "stream_operations",
+        "sorting_with_comparator",
+        "concurrent_collection",
+        "string_builder",
+    }
+)
+
+# Variable name fragments suggesting a list-like container (substring match)
+_LIST_HINT_RE = re.compile(r"list|array|items", re.IGNORECASE)
+
+
+@dataclass(**_SLOTS)
 class ComplexityInsight:
     """Represents a complexity-related finding in code."""
 
@@ -35,21 +101,26 @@ class ComplexityInsight:
     code_snippet: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ComplexityReport:
     """Report summarizing complexity analysis for a project."""
 
     total_files_analyzed: int = 0
     insights: List[ComplexityInsight] = field(default_factory=list)
     optimization_score: float = 0.0  # 0-100, higher is better
-    summary: Dict[str, int] = field(default_factory=dict)
+    summary: Counter = field(default_factory=Counter)  # complexity_type -> count
 
     def add_insight(self, insight: ComplexityInsight) -> None:
         """Add an insight to the report."""
         self.insights.append(insight)
         # Update summary counts
-        key = insight.complexity_type
-        self.summary[key] = self.summary.get(key, 0) + 1
+        self.summary[insight.complexity_type] += 1
+
+    def add_insights(self, insights: Iterable[ComplexityInsight]) -> None:
+        """Add a batch of insights (e.g. one file's worth) to the report."""
+        start = len(self.insights)
+        self.insights.extend(insights)
+        self.summary.update(map(attrgetter("complexity_type"), self.insights[start:]))
 
     def calculate_score(self) -> None:
         """Calculate optimization awareness score based on findings."""
@@ -60,34 +131,15 @@ class ComplexityReport:
         # Start with base score
         score = 50.0
 
-        # Positive indicators (add points) - Python patterns
-        good_practices = self.summary.get("efficient_data_structure", 0)
-        good_practices += self.summary.get("sorting_with_key", 0)
-        good_practices += self.summary.get("set_operations", 0)
-        good_practices += self.summary.get("dict_lookup", 0)
-        good_practices += self.summary.get("list_comprehension", 0)
-        good_practices += self.summary.get("generator_expression", 0)
-        good_practices += self.summary.get("binary_search", 0)
-        good_practices += self.summary.get("memoization", 0)
-
-        # Java-specific good patterns
-        good_practices += self.summary.get("stream_operations", 0)
-        good_practices += self.summary.get("sorting_with_comparator", 0)
-        good_practices += self.summary.get("concurrent_collection", 0)
-        good_practices += self.summary.get("string_builder", 0)
-
+        # Positive indicators (add points) - Python and Java patterns
+        summary = self.summary
+        good_practices = sum(summary[key] for key in _GOOD_PRACTICE_TYPES if key in summary)
         score += min(good_practices * 5, 40)  # Cap at +40
 
-        # Negative indicators (subtract points)
-        nested_loops = self.summary.get("nested_loops", 0)
-        inefficient_lookups = self.summary.get("inefficient_lookup", 0)
-        inefficient_membership = self.summary.get("inefficient_membership_test", 0)
-        inefficient_string_concat = self.summary.get("inefficient_string_concat", 0)
-
-        score -= min(nested_loops * 10, 30)  # Cap at -30
-        score -= min(inefficient_lookups * 8, 25)  # Cap at -25
-        score -= min(inefficient_membership * 5, 15)  # Cap at -15
-        score -= min(inefficient_string_concat * 5, 15)  # Cap at -15
+        # Negative indicators (subtract points, each capped)
+        for key, weight, cap in _PENALTIES:
+            if key in summary:
+                score -= min(summary[key] * weight, cap)
 
         # Clamp between 0 and 100
         self.optimization_score = max(0.0, min(100.0, score))
@@ -96,20 +148,98 @@ class ComplexityReport:
 class ComplexityAnalyzer(ast.NodeVisitor):
     """AST visitor that analyzes Python code for complexity patterns."""
 
-    def __init__(self, file_path: str, source_code: str):
+    def __init__(self, file_path: str, source_code: str, collect_details: bool = True):
         self.file_path = file_path
-        self.source_lines = source_code.splitlines()
+        self._source_code = source_code
+        self._source_lines: Optional[List[str]] = None  # Split on first get_line() call
         self.insights: List[ComplexityInsight] = []
+        self.collect_details = collect_details  # False: only count findings, skip building insights
+        self.counts: Counter = Counter()  # complexity_type -> number of findings
         self.loop_depth = 0  # Track nested loop depth
         self.function_locals: Set[str] = set()  # Track local variables in current function
+        # Node type -> bound handler, so visit() skips NodeVisitor's per-node name lookup
+        self._dispatch = {
+            ast.For: self.visit_For,
+            ast.Compare: self.visit_Compare,
+            ast.While: self.visit_While,
+            ast.ListComp: self.visit_ListComp,
+            ast.GeneratorExp: self.visit_GeneratorExp,
+            ast.Call: self.visit_Call,
+            ast.FunctionDef: self.visit_FunctionDef,
+            ast.Assign: self.visit_Assign,
+        }
+
+    def visit(self, node: ast.AST) -> None:
+        """
+        Walk the tree iteratively in the same pre-order as NodeVisitor.
+
+        Handlers only inspect their own node; children are pushed on an explicit
+        stack, so deeply nested code costs no Python recursion. A handler that
+        returns True has entered a loop, and a marker pushed below its children
+        restores loop_depth once the whole subtree has been visited. Function,
+        class and lambda bodies start from loop_depth 0 the same way.
+        """
+        # Bound methods and globals hoisted into locals for the per-node loop
+        get_handler = self._dispatch.get
+        scope_types = _SCOPE_TYPES
+        leave_loop = _LEAVE_LOOP
+        leave_scope = _LEAVE_SCOPE
+        iter_child_nodes = ast.iter_child_nodes
+        saved_depths: List[int] = []
+        stack: List[object] = [node]
+        pop = stack.pop
+        push = stack.append
+        extend = stack.extend
+        while stack:
+            current = pop()
+            if current is leave_loop:
+                self.loop_depth -= 1
+                continue
+            if current is leave_scope:
+                self.loop_depth = saved_depths.pop()
+                continue
+            node_type = type(current)
+            if node_type in scope_types:
+                # Code in a nested def/class/lambda does not run as part of the enclosing loop
+                saved_depths.append(self.loop_depth)
+                self.loop_depth = 0
+                push(leave_scope)
+            handler = get_handler(node_type)
+            if handler is not None and handler(current):
+                push(leave_loop)
+            extend(reversed(list(iter_child_nodes(current))))
+
+    @property
+    def source_lines(self) -> List[str]:
+        """Source split into lines, computed lazily since files without findings never need it."""
+        if self._source_lines is None:
+            self._source_lines = self._source_code.splitlines()
+        return self._source_lines
 
     def get_line(self, line_no: int) -> str:
         """Get source code line by number (1-indexed)."""
-        if 1 <= line_no <= len(self.source_lines):
-            return self.source_lines[line_no - 1].strip()
+        source_lines = self.source_lines
+        if 1 <= line_no <= len(source_lines):
+            return source_lines[line_no - 1].strip()
         return ""
 
-    def visit_For(self, node: ast.For) -> None:
+    def _emit(self, line_no: int, complexity_type: str, severity: str, description: str) -> None:
+        """Record a finding, building the full insight only when details are collected."""
+        self.counts[complexity_type] += 1
+        if not self.collect_details:
+            return
+        self.insights.append(
+            ComplexityInsight(
+                file_path=self.file_path,
+                line_number=line_no,
+                complexity_type=complexity_type,
+                severity=severity,
+                description=description,
+                code_snippet=self.get_line(line_no),
+            )
+        )
+
+    def visit_For(self, node: ast.For) -> bool:
         """Detect for loops and nested loops."""
         self.loop_depth += 1
 
@@ -117,96 +247,67 @@ class ComplexityAnalyzer(ast.NodeVisitor):
         if self.loop_depth >= 2:
             severity = "suggestion" if self.loop_depth == 2 else "info"
             complexity = "O(n²)" if self.loop_depth == 2 else f"O(n^{self.loop_depth})"
-            self.insights.append(
-                ComplexityInsight(
-                    file_path=self.file_path,
-                    line_number=node.lineno,
-                    complexity_type="nested_loops",
-                    severity=severity,
-                    description=f"Nested loop detected ({complexity} complexity). "
-                    f"Consider if this can be optimized with better data structures or algorithms.",
-                    code_snippet=self.get_line(node.lineno),
-                )
+            self._emit(
+                node.lineno,
+                "nested_loops",
+                severity,
+                f"Nested loop detected ({complexity} complexity). "
+                f"Consider if this can be optimized with better data structures or algorithms.",
             )
 
-        # Check for inefficient membership tests in loops (x in list)
-        # Scan the entire loop body, not just the first statement
-        loop_children = []
-        for stmt in node.body:
-            loop_children.extend(list(ast.walk(stmt)))
-        for child in loop_children:
-            if isinstance(child, ast.Compare):
-                # Look for patterns like: if x in some_list
-                for op in child.ops:
-                    if isinstance(op, (ast.In, ast.NotIn)):
-                        # Check if comparing against a list (inefficient)
-                        if isinstance(child.comparators[0], ast.Name):
-                            var_name = child.comparators[0].id
-                            # Heuristic: if variable name suggests it's a list
-                            if any(hint in var_name.lower() for hint in ["list", "array", "items"]):
-                                self.insights.append(
-                                    ComplexityInsight(
-                                        file_path=self.file_path,
-                                        line_number=child.lineno,
-                                        complexity_type="inefficient_membership_test",
-                                        severity="suggestion",
-                                        description=f"Membership test inside loop on '{var_name}'. "
-                                        f"Consider using a set or dict for O(1) lookups instead of O(n).",
-                                        code_snippet=self.get_line(child.lineno),
-                                    )
-                                )
-
-        self.generic_visit(node)
-        self.loop_depth -= 1
-
-    def visit_While(self, node: ast.While) -> None:
+        return True
+
+    def visit_Compare(self, node: ast.Compare) -> None:
+        """Detect inefficient membership tests (x in list) inside loops."""
+        if self.loop_depth >= 1:
+            for op in node.ops:
+                if isinstance(op, (ast.In, ast.NotIn)):
+                    # Check if comparing against a list (inefficient)
+                    if isinstance(node.comparators[0], ast.Name):
+                        var_name = node.comparators[0].id
+                        # Heuristic: if variable name suggests it's a list
+                        if _LIST_HINT_RE.search(var_name):
+                            self._emit(
+                                node.lineno,
+                                "inefficient_membership_test",
+                                "suggestion",
+                                f"Membership test inside loop on '{var_name}'. "
+                                f"Consider using a set or dict for O(1) lookups instead of O(n).",
+                            )
+
+    def visit_While(self, node: ast.While) -> bool:
         """Track while loops for nesting."""
         self.loop_depth += 1
 
         if self.loop_depth >= 2:
-            self.insights.append(
-                ComplexityInsight(
-                    file_path=self.file_path,
-                    line_number=node.lineno,
-                    complexity_type="nested_loops",
-                    severity="suggestion",
-                    description=f"Nested while loop detected. Review for potential optimization.",
-                    code_snippet=self.get_line(node.lineno),
-                )
+            self._emit(
+                node.lineno,
+                "nested_loops",
+                "suggestion",
+                f"Nested while loop detected. Review for potential optimization.",
             )
 
-        self.generic_visit(node)
-        self.loop_depth -= 1
+        return True
 
     def visit_ListComp(self, node: ast.ListComp) -> None:
         """Detect list comprehensions (good practice)."""
         # List comprehensions are generally more efficient than explicit loops
         if len(node.generators) == 1:  # Single-level comprehension
-            self.insights.append(
-                ComplexityInsight(
-                    file_path=self.file_path,
-                    line_number=node.lineno,
-                    complexity_type="list_comprehension",
-                    severity="good_practice",
-                    description="List comprehension used (efficient and Pythonic).",
-                    code_snippet=self.get_line(node.lineno),
-                )
+            self._emit(
+                node.lineno,
+                "list_comprehension",
+                "good_practice",
+                "List comprehension used (efficient and Pythonic).",
             )
-        self.generic_visit(node)
 
     def visit_GeneratorExp(self, node: ast.GeneratorExp) -> None:
         """Detect generator expressions (memory efficient)."""
-        self.insights.append(
-            ComplexityInsight(
-                file_path=self.file_path,
-                line_number=node.lineno,
-                complexity_type="generator_expression",
-                severity="good_practice",
-                description="Generator expression used (memory efficient, lazy evaluation).",
-                code_snippet=self.get_line(node.lineno),
-            )
+        self._emit(
+            node.lineno,
+            "generator_expression",
+            "good_practice",
+            "Generator expression used (memory efficient, lazy evaluation).",
         )
-        self.generic_visit(node)
 
     def visit_Call(self, node: ast.Call) -> None:
         """Detect function calls related to complexity."""
@@ -218,150 +319,182 @@ class ComplexityAnalyzer(ast.NodeVisitor):
         elif isinstance(node.func, ast.Attribute):
             func_name = node.func.attr
 
-        if func_name:
-            # Detect sorting operations
-            if func_name in ["sort", "sorted"]:
-                # Check if using key parameter (good practice)
-                has_key = any(kw.arg == "key" for kw in node.keywords)
-                if has_key:
-                    self.insights.append(
-                        ComplexityInsight(
-                            file_path=self.file_path,
-                            line_number=node.lineno,
-                            complexity_type="sorting_with_key",
-                            severity="good_practice",
-                            description="Sorting with custom key function (demonstrates awareness of sort optimization).",
-                            code_snippet=self.get_line(node.lineno),
-                        )
-                    )
+        handler = self._CALL_HANDLERS.get(func_name)
+        if handler is not None:
+            handler(self, node)
+
+    def _call_sort(self, node: ast.Call) -> None:
+        """Detect sorting operations that use a key function (good practice)."""
+        if any(kw.arg == "key" for kw in node.keywords):
+            self._emit(
+                node.lineno,
+                "sorting_with_key",
+                "good_practice",
+                "Sorting with custom key function (demonstrates awareness of sort optimization).",
+            )
 
-            # Detect binary search (indicates algorithm knowledge)
-            if func_name in ["bisect", "bisect_left", "bisect_right"]:
-                self.insights.append(
-                    ComplexityInsight(
-                        file_path=self.file_path,
-                        line_number=node.lineno,
-                        complexity_type="binary_search",
-                        severity="good_practice",
-                        description="Binary search used (O(log n) - demonstrates algorithm knowledge).",
-                        code_snippet=self.get_line(node.lineno),
-                    )
-                )
+    def _call_bisect(self, node: ast.Call) -> None:
+        """Detect binary search (indicates algorithm knowledge)."""
+        self._emit(
+            node.lineno,
+            "binary_search",
+            "good_practice",
+            "Binary search used (O(log n) - demonstrates algorithm knowledge).",
+        )
 
-            # Detect set() or dict() calls (even nested in other calls)
-            if func_name == "set":
-                self.insights.append(
-                    ComplexityInsight(
-                        file_path=self.file_path,
-                        line_number=node.lineno,
-                        complexity_type="set_operations",
-                        severity="good_practice",
-                        description="Set created for efficient O(1) operations.",
-                        code_snippet=self.get_line(node.lineno),
-                    )
-                )
-            elif func_name == "dict":
-                self.insights.append(
-                    ComplexityInsight(
-                        file_path=self.file_path,
-                        line_number=node.lineno,
-                        complexity_type="dict_lookup",
-                        severity="good_practice",
-                        description="Dictionary created for efficient O(1) lookups.",
-                        code_snippet=self.get_line(node.lineno),
-                    )
-                )
+    def _call_set(self, node: ast.Call) -> None:
+        """Detect set() calls (even nested in other calls)."""
+        self._emit(
+            node.lineno,
+            "set_operations",
+            "good_practice",
+            "Set created for efficient O(1) operations.",
+        )
 
-        self.generic_visit(node)
+    def _call_dict(self, node: ast.Call) -> None:
+        """Detect dict() calls (even nested in other calls)."""
+        self._emit(
+            node.lineno,
+            "dict_lookup",
+            "good_practice",
+            "Dictionary created for efficient O(1) lookups.",
+        )
+
+    # Called function name -> handler, looked up once per call node
+    _CALL_HANDLERS = {
+        "sort": _call_sort,
+        "sorted": _call_sort,
+        "bisect": _call_bisect,
+        "bisect_left": _call_bisect,
+        "bisect_right": _call_bisect,
+        "set": _call_set,
+        "dict": _call_dict,
+    }
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """Analyze function definitions."""
         # Look for memoization decorators
         for decorator in node.decorator_list:
-            decorator_name = None
-            if isinstance(decorator, ast.Name):
-                decorator_name = decorator.id
-            elif isinstance(decorator, ast.Attribute):
-                decorator_name = decorator.attr
-            elif isinstance(decorator, ast.Call):
-                # Handle @lru_cache() or @lru_cache(maxsize=...)
-                if isinstance(decorator.func, ast.Name):
-                    decorator_name = decorator.func.id
-                elif isinstance(decorator.func, ast.Attribute):
-                    decorator_name = decorator.func.attr
-
-            if decorator_name in ["lru_cache", "cache", "memoize"]:
-                self.insights.append(
-                    ComplexityInsight(
-                        file_path=self.file_path,
-                        line_number=node.lineno,
-                        complexity_type="memoization",
-                        severity="good_practice",
-                        description=f"Memoization decorator (@{decorator_name}) used - reduces time complexity through caching.",
-                        code_snippet=self.get_line(node.lineno),
-                    )
+            decorator_name = _decorator_name(decorator)
+            if decorator_name in _MEMO_DECORATORS:
+                self._emit(
+                    node.lineno,
+                    "memoization",
+                    "good_practice",
+                    f"Memoization decorator (@{decorator_name}) used - reduces time complexity through caching.",
                 )
 
-        self.generic_visit(node)
-
     def visit_Assign(self, node: ast.Assign) -> None:
         """Detect data structure usage patterns."""
         # Check for set or dict creation (efficient data structures)
         if isinstance(node.value, ast.Set):
-            self.insights.append(
-                ComplexityInsight(
-                    file_path=self.file_path,
-                    line_number=node.lineno,
-                    complexity_type="efficient_data_structure",
-                    severity="good_practice",
-                    description="Set used for O(1) membership tests (efficient choice).",
-                    code_snippet=self.get_line(node.lineno),
-                )
+            self._emit(
+                node.lineno,
+                "efficient_data_structure",
+                "good_practice",
+                "Set used for O(1) membership tests (efficient choice).",
             )
         elif isinstance(node.value, ast.Dict):
-            self.insights.append(
-                ComplexityInsight(
-                    file_path=self.file_path,
-                    line_number=node.lineno,
-                    complexity_type="efficient_data_structure",
-                    severity="good_practice",
-                    description="Dictionary used for O(1) lookups (efficient choice).",
-                    code_snippet=self.get_line(node.lineno),
-                )
+            self._emit(
+                node.lineno,
+                "efficient_data_structure",
+                "good_practice",
+                "Dictionary used for O(1) lookups (efficient choice).",
             )
-        elif isinstance(node.value, ast.Call):
-            # Check for set() or dict() constructor calls
-            if isinstance(node.value.func, ast.Name):
-                if node.value.func.id == "set":
-                    self.insights.append(
-                        ComplexityInsight(
-                            file_path=self.file_path,
-                            line_number=node.lineno,
-                            complexity_type="set_operations",
-                            severity="good_practice",
-                            description="Set created for efficient operations.",
-                            code_snippet=self.get_line(node.lineno),
-                        )
-                    )
-                elif node.value.func.id == "dict":
-                    self.insights.append(
-                        ComplexityInsight(
-                            file_path=self.file_path,
-                            line_number=node.lineno,
-                            complexity_type="dict_lookup",
-                            severity="good_practice",
-                            description="Dictionary created for efficient lookups.",
-                            code_snippet=self.get_line(node.lineno),
-                        )
-                    )
+        # set()/dict() constructor calls are reported by visit_Call
+
+
+def _decorator_name(decorator: ast.expr) -> Optional[str]:
+    """Return the bare name of a decorator: @name, @module.name, or either form called."""
+    if isinstance(decorator, ast.Call):
+        # Handle @lru_cache() or @lru_cache(maxsize=...)
+        decorator = decorator.func
+    if isinstance(decorator, ast.Name):
+        return decorator.id
+    if isinstance(decorator, ast.Attribute):
+        return decorator.attr
+    return None
+
+
+def _analyze_python_source(
+    file_path: str, source_code: str, collect_details: bool = True
+) -> Tuple[Tuple[ComplexityInsight, ...], Dict[str, int]]:
+    """Parse and visit a single Python source without consulting the cache."""
+    try:
+        # Same as ast.parse, minus its wrapper call and without inheriting this module's future flags
+        tree = compile(source_code, file_path, "exec", flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+        analyzer = ComplexityAnalyzer(file_path, source_code, collect_details=collect_details)
+        analyzer.visit(tree)
+        return tuple(analyzer.insights), dict(analyzer.counts)
+    except SyntaxError:
+        # Skip files with syntax errors
+        return (), {}
+    except Exception:
+        # Skip files that can't be analyzed
+        return (), {}
+
+
+def _analyze_one(job: Tuple[str, str, bool]) -> Tuple[Tuple[ComplexityInsight, ...], Dict[str, int]]:
+    """Process-pool entry point: analyze one (file_path, source_code, collect_details) job."""
+    return _analyze_python_source(*job)
+
 
-        self.generic_visit(node)
+def _cache_key(file_path: str, source_code: str, collect_details: bool) -> Tuple[str, bytes, bool]:
+    """Build the memoization key for a file: path, content digest and detail level."""
+    digest = hashlib.blake2b(source_code.encode("utf-8", errors="surrogatepass"), digest_size=16).digest()
+    return (file_path, digest, collect_details)
+
+
+def _cache_get(key: Tuple[str, bytes, bool]) -> Optional[Tuple[Tuple[ComplexityInsight, ...], Dict[str, int]]]:
+    """Look up a memoized result, marking it as recently used."""
+    with _INSIGHT_CACHE_LOCK:
+        cached = _INSIGHT_CACHE.get(key)
+        if cached is not None:
+            _INSIGHT_CACHE.move_to_end(key)
+    return cached
+
+
+def _cache_put(key: Tuple[str, bytes, bool], result: Tuple[Tuple[ComplexityInsight, ...], Dict[str, int]]) -> None:
+    """Store a result, evicting the least recently used entry when full."""
+    with _INSIGHT_CACHE_LOCK:
+        _INSIGHT_CACHE[key] = result
+        if len(_INSIGHT_CACHE) > _INSIGHT_CACHE_SIZE:
+            _INSIGHT_CACHE.popitem(last=False)
+
+
+def _analyze_python_cached(
+    file_path: str, source_code: str, collect_details: bool = True
+) -> Tuple[Tuple[ComplexityInsight, ...], Dict[str, int]]:
+    """Return (insights, counts) for a file, memoized on path, content hash and detail level."""
+    key = _cache_key(file_path, source_code, collect_details)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    result = _analyze_python_source(file_path, source_code, collect_details)
+    _cache_put(key, result)
+    return result
+
+
+def _analyze_in_pool(
+    jobs: List[Tuple[str, str, bool]],
+) -> Optional[List[Tuple[Tuple[ComplexityInsight, ...], Dict[str, int]]]]:
+    """Analyze jobs across worker processes; returns None if a pool cannot be used."""
+    try:
+        with ProcessPoolExecutor() as executor:
+            return list(executor.map(_analyze_one, jobs, chunksize=_PARALLEL_CHUNKSIZE))
+    except (OSError, RuntimeError, BrokenProcessPool) as e:
+        logger.warning("Parallel complexity analysis unavailable, falling back to serial: %s", e)
+        return None
 
 
 def analyze_python_file(file_path: str, source_code: str) -> List[ComplexityInsight]:
     """
     Analyze a single Python file for complexity patterns.
 
+    Results are memoized on (file_path, content hash), so re-analyzing an
+    unchanged file skips parsing and traversal entirely.
+
     Args:
         file_path: Path to the Python file
         source_code: Source code content
@@ -369,35 +502,46 @@ def analyze_python_file(file_path: str, source_code: str) -> List[ComplexityInsi
     Returns:
         List of complexity insights found
     """
-    try:
-        tree = ast.parse(source_code)
-        analyzer = ComplexityAnalyzer(file_path, source_code)
-        analyzer.visit(tree)
-        return analyzer.insights
-    except SyntaxError:
-        # Skip files with syntax errors
-        return []
-    except Exception:
-        # Skip files that can't be analyzed
-        return []
+    insights, _ = _analyze_python_cached(file_path, source_code)
+    return list(insights)
 
 
-def analyze_python_project(python_files: List[Tuple[str, str]]) -> ComplexityReport:
+def analyze_python_project(python_files: List[Tuple[str, str]], collect_details: bool = True) -> ComplexityReport:
     """
     Analyze multiple Python files in a project.
 
     Args:
         python_files: List of (file_path, source_code) tuples
+        collect_details: If False, only the summary counts and score are
+            computed and report.insights stays empty (enough for a
+            non-verbose format_report)
 
     Returns:
         ComplexityReport with aggregated insights
     """
     report = ComplexityReport(total_files_analyzed=len(python_files))
 
-    for file_path, source_code in python_files:
-        insights = analyze_python_file(file_path, source_code)
-        for insight in insights:
-            report.add_insight(insight)
+    keys = [_cache_key(file_path, source_code, collect_details) for file_path, source_code in python_files]
+    results = [_cache_get(key) for key in keys]
+
+    # Files are independent, so large batches of uncached files are spread across processes
+    misses = [i for i, result in enumerate(results) if result is None]
+    if len(misses) > _PARALLEL_MIN_FILES:
+        computed = _analyze_in_pool([(*python_files[i], collect_details) for i in misses])
+        if computed is not None:
+            for i, result in zip(misses, computed):
+                results[i] = result
+                _cache_put(keys[i], result)
+
+    for i, (file_path, source_code) in enumerate(python_files):
+        result = results[i]
+        if result is None:
+            result = _analyze_python_source(file_path, source_code, collect_details)
+            _cache_put(keys[i], result)
+        insights, counts = result
+        # counts tally every finding, even those without a materialized insight
+        report.insights.extend(insights)
+        report.summary.update(counts)
 
     report.calculate_score()
     return report
@@ -440,26 +584,9 @@ def format_report(report: ComplexityReport, verbose: bool = False) -> str:
     good_practices = []
     suggestions = []
 
-    good_types = {
-        # Python patterns
-        "efficient_data_structure",
-        "sorting_with_key",
-        "set_operations",
-        "dict_lookup",
-        "list_comprehension",
-        "generator_expression",
-        "binary_search",
-        "memoization",
-        # Java patterns
-        "stream_operations",
-        "sorting_with_comparator",
-        "concurrent_collection",
-        "string_builder",
-    }
-
     for key, count in sorted(report.summary.items()):
         display_name = key.replace("_", " ").title()
-        if key in good_types:
+        if key in _GOOD_PRACTICE_TYPES:
             good_practices.append(f"  [+] {display_name}: {count}")
         else:
             suggestions.append(f"  • {display_name}: {count}")
@@ -477,14 +604,11 @@ def format_report(report: ComplexityReport, verbose: bool = False) -> str:
         lines.append("DETAILED FINDINGS")
         lines.append("-" * 70)
 
-        # Group insights by file
-        by_file: Dict[str, List[ComplexityInsight]] = {}
-        for insight in report.insights:
-            by_file.setdefault(insight.file_path, []).append(insight)
-
-        for file_path in sorted(by_file.keys()):
+        # Group insights by file (sorted() is stable, so per-file order is preserved)
+        by_path = attrgetter("file_path")
+        for file_path, file_insights in groupby(sorted(report.insights, key=by_path), key=by_path):
             lines.append(f"\n[File] {file_path}")
-            for insight in by_file[file_path]:
+            for insight in file_insights:
                 icon = "[+]" if insight.severity == "good_practice" else "[!]"
                 lines.append(f"  {icon} Line {insight.line_number}: {insight.description}")
                 if insight.code_snippet:
@@ -752,17 +876,18 @@ def analyze_java_project(java_files: List[Tuple[str, str]]) -> ComplexityReport:
     report = ComplexityReport(total_files_analyzed=len(java_files))
 
     for file_path, source_code in java_files:
-        insights = analyze_java_file(file_path, source_code)
-        for insight in insights:
-            report.add_insight(insight)
+        report.add_insights(analyze_java_file(file_path, source_code))
 
     report.calculate_score()
     return report
 
 
-def analyze_project(files: List[Tuple[str, str]], language: str = "auto") -> ComplexityReport:
+def analyze_project(files: List[Tuple[str, str]], language: str = "auto", collect_details: bool = True) -> ComplexityReport:
     """
     Analyze files in a project for complexity patterns.
+
+    With collect_details=False, Python files contribute only summary counts
+    (no insight objects or code snippets are built).
     """
     if language == "auto":
         # Group files by extension
@@ -773,24 +898,22 @@ def analyze_project(files: List[Tuple[str, str]], language: str = "auto") -> Com
         report = ComplexityReport()
 
         if python_files:
-            py_report = analyze_python_project(python_files)
+            py_report = analyze_python_project(python_files, collect_details=collect_details)
             report.total_files_analyzed += py_report.total_files_analyzed
             report.insights.extend(py_report.insights)
-            for key, value in py_report.summary.items():
-                report.summary[key] = report.summary.get(key, 0) + value
+            report.summary.update(py_report.summary)
 
         if java_files:
             java_report = analyze_java_project(java_files)
             report.total_files_analyzed += java_report.total_files_analyzed
             report.insights.extend(java_report.insights)
-            for key, value in java_report.summary.items():
-                report.summary[key] = report.summary.get(key, 0) + value
+            report.summary.update(java_report.summary)
 
         report.calculate_score()
         return report
 
     elif language == "python":
-        return analyze_python_project(files)
+        return analyze_python_project(files, collect_details=collect_details)
     elif language == "java":
         return analyze_java_project(files)
     else:
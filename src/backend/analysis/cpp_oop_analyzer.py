@@ -14,20 +14,29 @@ Analysis Phases:
 3. CppOOPAnalyzer - Analyzes C++ OOP principles (THIS MODULE)
 """
 
+import hashlib
+import logging
 import re
+import sys
+import threading
 import zipfile
-from collections import defaultdict
-from dataclasses import asdict, dataclass, field
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, replace
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 try:
     import clang.cindex
     from clang.cindex import AccessSpecifier, CursorKind
 
     CLANG_AVAILABLE = True
+    PARSE_OPTIONS = clang.cindex.TranslationUnit.PARSE_SKIP_FUNCTION_BODIES | clang.cindex.TranslationUnit.PARSE_INCOMPLETE
 except ImportError:
     CLANG_AVAILABLE = False
+    PARSE_OPTIONS = 0
     print("Warning: libclang not installed. Install with: pip install libclang")
 
 try:
@@ -37,6 +46,40 @@ except ImportError:
     MetadataExtractor = None
     FileClassifier = None
 
+logger = logging.getLogger(__name__)
+
+# Template argument list in a base-class spelling, e.g. the "<int>" of "Base<int>"
+_TEMPLATE_ARGS_RE = re.compile(r"<.*>")
+
+# Access label by AccessSpecifier value: INVALID, PUBLIC, PROTECTED, PRIVATE, NONE.
+# Members without a specifier (INVALID/NONE) are reported as public, the struct default.
+_ACCESS_NAMES = ("public", "public", "protected", "private", "public")
+
+# Method names treated as a singleton accessor
+_SINGLETON_ACCESSORS = frozenset({"getInstance", "instance"})
+
+# Projects with more C++ files than this are parsed in a process pool
+_PARALLEL_MIN_FILES = 8
+_PARALLEL_CHUNKSIZE = 4
+
+# LRU of per-file results keyed by a digest of the source; larger sources are not cached
+_ANALYSIS_CACHE_SIZE = 512
+_ANALYSIS_CACHE_MAX_BYTES = 1 << 20
+_ANALYSIS_CACHE: "OrderedDict[bytes, CppOOPAnalysis]" = OrderedDict()
+# The API analyzes projects on several threads; reordering and eviction must not interleave
+_ANALYSIS_CACHE_LOCK = threading.Lock()
+
+# Shared libclang index, created on first use (one per process)
+_INDEX = None
+
+
+def _get_index():
+    """Return the process-wide libclang Index, creating it on first use."""
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = clang.cindex.Index.create()
+    return _INDEX
+
 
 @dataclass
 class CppOOPAnalysis:
@@ -70,7 +113,12 @@ class CppOOPAnalysis:
     design_patterns: List[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # Every field is a primitive or a flat list of str, so a shallow copy
+        # with fresh lists matches asdict() without its recursive deep copy.
+        data = self.__dict__.copy()
+        data["abstract_classes"] = list(self.abstract_classes)
+        data["design_patterns"] = list(self.design_patterns)
+        return data
 
 
 @dataclass
@@ -83,6 +131,7 @@ class CppClassInfo:
     inherits: List[str] = field(default_factory=list)
 
     methods: List[Dict] = field(default_factory=list)
+    method_names: Set[str] = field(default_factory=set)
     fields: List[Dict] = field(default_factory=list)
 
     is_template: bool = False
@@ -98,70 +147,95 @@ class CppOOPAnalyzer:
         self.classes: Dict[str, CppClassInfo] = {}
         self.inheritance_tree: Dict[str, List[str]] = defaultdict(list)
         self.namespaces: Set[str] = set()
-
-    def analyze_file(self, content: str, filename: str = "temp.cpp") -> CppOOPAnalysis:
-        """Main entry point: analyze a single C++ file using libclang."""
+        self._patterns: Set[str] = set()
+        self._abstract_set: Set[str] = set()  # mirrors analysis.abstract_classes for O(1) membership
+        # Member tallies indexed by AccessSpecifier value, stored on the analysis after the walk
+        self._method_access_counts = [0] * len(_ACCESS_NAMES)
+        self._field_access_counts = [0] * len(_ACCESS_NAMES)
+
+        # Cursor kind -> handler; a handler returns whether to descend into the cursor's children
+        self._dispatch = (
+            {
+                CursorKind.CLASS_DECL: self._visit_class_decl,
+                CursorKind.STRUCT_DECL: self._visit_struct_decl,
+                CursorKind.NAMESPACE: self._visit_namespace,
+            }
+            if CLANG_AVAILABLE
+            else {}
+        )
+
+    def analyze_file(self, content: Union[str, bytes], filename: str = "temp.cpp") -> CppOOPAnalysis:
+        """Main entry point: analyze a single C++ file using libclang.
+
+        ``content`` may be text or the raw bytes of the file; libclang reads either.
+        """
 
         if not CLANG_AVAILABLE:
             return self.analysis
 
         try:
-            import tempfile
-
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".cpp", delete=False) as f:
-                f.write(content)
-                temp_path = f.name
-
-            index = clang.cindex.Index.create()
-            translation_unit = index.parse(temp_path, args=["-std=c++17", "-x", "c++"])
+            # Hand the source to libclang as an unsaved buffer instead of a temp file on disk.
+            # Only declarations are inspected, so function bodies are skipped.
+            index = _get_index()
+            translation_unit = index.parse(
+                filename,
+                args=["-std=c++17", "-x", "c++"],
+                unsaved_files=[(filename, content)],
+                options=PARSE_OPTIONS,
+            )
 
             self._traverse_ast(translation_unit.cursor)
+            self.analysis.namespaces_used = len(self.namespaces)
+            self._store_access_counts()
 
             self._compute_inheritance_depth()
             self._detect_design_patterns()
 
-            import os
-
-            os.unlink(temp_path)
-
         except Exception as e:
-            print(f"Warning: Failed to parse C++ file: {e}")
+            logger.warning("Failed to parse C++ file %s: %s", filename, e)
 
         return self.analysis
 
-    def _traverse_ast(self, cursor, parent_class=None):
-        """Recursively traverse the AST."""
+    def _traverse_ast(self, cursor):
+        """Traverse the AST depth-first in source order with an explicit stack.
+
+        Class and struct subtrees are handed to ``_analyze_class``, which owns
+        their members, so they are not walked a second time here.
+        """
 
-        if cursor.kind == CursorKind.CLASS_DECL:
-            self._analyze_class(cursor, is_struct=False)
+        dispatch = self._dispatch
+        stack = [cursor]
 
-        elif cursor.kind == CursorKind.STRUCT_DECL:
-            self._analyze_class(cursor, is_struct=True)
+        while stack:
+            node = stack.pop()
 
-        elif cursor.kind == CursorKind.NAMESPACE:
-            namespace_name = cursor.spelling
-            if namespace_name:  # Skip anonymous namespaces
-                self.namespaces.add(namespace_name)
-                self.analysis.namespaces_used = len(self.namespaces)
+            handler = dispatch.get(node.kind)
+            if handler is not None and not handler(node):
+                continue
 
-        # Method declarations (when inside a class)
-        elif cursor.kind in (CursorKind.CXX_METHOD, CursorKind.FUNCTION_DECL) and parent_class:
-            self._analyze_method(cursor, parent_class)
+            # Reversed so children pop in source order (bases before derived classes)
+            stack.extend(reversed(list(node.get_children())))
 
-        # Field declarations (when inside a class)
-        elif cursor.kind == CursorKind.FIELD_DECL and parent_class:
-            self._analyze_field(cursor, parent_class)
+    def _visit_class_decl(self, cursor) -> bool:
+        self._analyze_class(cursor, is_struct=False)
+        return False
 
-        for child in cursor.get_children():
-            new_parent = parent_class
-            if cursor.kind in (CursorKind.CLASS_DECL, CursorKind.STRUCT_DECL):
-                new_parent = cursor.spelling
-            self._traverse_ast(child, new_parent)
+    def _visit_struct_decl(self, cursor) -> bool:
+        self._analyze_class(cursor, is_struct=True)
+        return False
+
+    def _visit_namespace(self, cursor) -> bool:
+        namespace_name = cursor.spelling
+        if namespace_name:  # Skip anonymous namespaces
+            self.namespaces.add(namespace_name)
+        return True
 
     def _analyze_class(self, cursor, is_struct=False):
-        """Analyze a class or struct declaration."""
+        """Analyze a class or struct declaration and its members in a single pass."""
 
-        class_name = cursor.spelling
+        # Names are interned: the same class, method and base names recur across
+        # overloads, hierarchies and files, and are reused as dict/set keys.
+        class_name = sys.intern(cursor.spelling)
         if not class_name:  # Skip anonymous classes
             return
 
@@ -187,26 +261,51 @@ class CppOOPAnalyzer:
         if class_info.inherits:
             self.analysis.classes_with_inheritance += 1
 
+        # Register before visiting members so methods and fields are recorded on it
+        self.classes[class_name] = class_info
+
         has_pure_virtual = False
-        for child in cursor.get_children():
-            if child.kind == CursorKind.CXX_METHOD:
-                self._analyze_method(child, class_name)
+        nested_classes = []
+        # Members are attributed to the nearest enclosing class, so unions, member
+        # templates, friend declarations and method bodies are walked as part of
+        # this class. Nested classes and structs own their members and are analyzed
+        # after this one.
+        stack = list(reversed(list(cursor.get_children())))
+        while stack:
+            node = stack.pop()
+            node_kind = node.kind
+
+            if node_kind in (CursorKind.CLASS_DECL, CursorKind.STRUCT_DECL):
+                # ``struct P {...} p;`` also lists the struct under the field declaration
+                if node not in nested_classes:
+                    nested_classes.append(node)
+                continue
+
+            if node_kind in (CursorKind.CXX_METHOD, CursorKind.FUNCTION_DECL):
+                method_info = self._analyze_method(node, class_name)
 
-                if child.is_pure_virtual_method():
-                    has_pure_virtual = True
-                    class_info.has_virtual_methods = True
-                elif child.is_virtual_method():
-                    class_info.has_virtual_methods = True
+                if method_info is not None:
+                    if method_info["is_pure_virtual"]:
+                        has_pure_virtual = True
+                        class_info.has_virtual_methods = True
+                    elif method_info["is_virtual"]:
+                        class_info.has_virtual_methods = True
 
-            elif child.kind == CursorKind.FIELD_DECL:
-                self._analyze_field(child, class_name)
+            elif node_kind == CursorKind.FIELD_DECL:
+                self._analyze_field(node, class_name)
+
+            stack.extend(reversed(list(node.get_children())))
 
         if has_pure_virtual:
             class_info.is_abstract = True
-            if class_name not in self.analysis.abstract_classes:
+            if class_name not in self._abstract_set:
+                self._abstract_set.add(class_name)
                 self.analysis.abstract_classes.append(class_name)
 
-        self.classes[class_name] = class_info
+        self._detect_class_patterns(class_info)
+
+        for nested in nested_classes:
+            self._analyze_class(nested, is_struct=nested.kind == CursorKind.STRUCT_DECL)
 
     def _get_base_classes(self, cursor) -> List[str]:
         """Extract base class names from a class cursor."""
@@ -214,22 +313,22 @@ class CppOOPAnalyzer:
         for child in cursor.get_children():
             if child.kind == CursorKind.CXX_BASE_SPECIFIER:
                 base_type = child.type.spelling
-                # Clean up
-                base_name = re.sub(r"<.*>", "", base_type)
-                base_name = base_name.split("::")[-1]
-                base_name = base_name.strip()
+                # Clean up: drop template arguments and namespace qualifiers
+                if "<" in base_type:
+                    base_type = _TEMPLATE_ARGS_RE.sub("", base_type)
+                base_name = sys.intern(base_type.rpartition("::")[2].strip())
                 if base_name:
                     bases.append(base_name)
         return bases
 
-    def _analyze_method(self, cursor, class_name):
-        """Analyze a method declaration."""
+    def _analyze_method(self, cursor, class_name) -> Optional[Dict]:
+        """Analyze a method declaration and return its recorded info."""
 
-        method_name = cursor.spelling
+        method_name = sys.intern(cursor.spelling)
         if not method_name:
-            return
+            return None
 
-        access = cursor.access_specifier
+        access_id = cursor.access_specifier.value
 
         if method_name.startswith("operator"):
             self.analysis.operator_overloads += 1
@@ -243,111 +342,112 @@ class CppOOPAnalyzer:
         # Override detection (heuristic)
         if is_virtual and not is_pure_virtual:
             for base in self.classes.get(class_name, CppClassInfo(class_name)).inherits:
-                if base in self.classes:
-                    for m in self.classes[base].methods:
-                        if m["name"] == method_name:
-                            self.analysis.override_methods += 1
-                            break
-
-        if access == AccessSpecifier.PRIVATE:
-            self.analysis.private_methods += 1
-        elif access == AccessSpecifier.PROTECTED:
-            self.analysis.protected_methods += 1
-        elif access == AccessSpecifier.PUBLIC:
-            self.analysis.public_methods += 1
+                if base in self.classes and method_name in self.classes[base].method_names:
+                    self.analysis.override_methods += 1
+
+        self._method_access_counts[access_id] += 1
 
         # Store method info
         method_info = {
             "name": method_name,
-            "access": self._access_to_string(access),
+            "access": _ACCESS_NAMES[access_id],
             "is_virtual": is_virtual,
             "is_pure_virtual": is_pure_virtual,
         }
 
         if class_name in self.classes:
             self.classes[class_name].methods.append(method_info)
+            self.classes[class_name].method_names.add(method_name)
+
+        return method_info
 
     def _analyze_field(self, cursor, class_name):
         """Analyze a field declaration."""
 
-        field_name = cursor.spelling
+        field_name = sys.intern(cursor.spelling)
         if not field_name:
             return
 
-        access = cursor.access_specifier
-
-        if access == AccessSpecifier.PRIVATE:
-            self.analysis.private_fields += 1
-        elif access == AccessSpecifier.PROTECTED:
-            self.analysis.protected_fields += 1
-        elif access == AccessSpecifier.PUBLIC:
-            self.analysis.public_fields += 1
+        access_id = cursor.access_specifier.value
+        self._field_access_counts[access_id] += 1
 
         field_info = {
             "name": field_name,
-            "access": self._access_to_string(access),
+            "access": _ACCESS_NAMES[access_id],
             "type": cursor.type.spelling,
         }
 
         if class_name in self.classes:
             self.classes[class_name].fields.append(field_info)
 
-    def _access_to_string(self, access):
-        """Convert AccessSpecifier to string."""
-        if access == AccessSpecifier.PRIVATE:
-            return "private"
-        elif access == AccessSpecifier.PROTECTED:
-            return "protected"
-        elif access == AccessSpecifier.PUBLIC:
-            return "public"
-        return "public"  # default for structs
+    def _store_access_counts(self):
+        """Copy the per-specifier member tallies onto the analysis."""
+        methods, fields = self._method_access_counts, self._field_access_counts
+        private, protected, public = AccessSpecifier.PRIVATE.value, AccessSpecifier.PROTECTED.value, AccessSpecifier.PUBLIC.value
+
+        self.analysis.private_methods = methods[private]
+        self.analysis.protected_methods = methods[protected]
+        self.analysis.public_methods = methods[public]
+        self.analysis.private_fields = fields[private]
+        self.analysis.protected_fields = fields[protected]
+        self.analysis.public_fields = fields[public]
 
     def _compute_inheritance_depth(self):
-        """Compute the maximum inheritance chain depth."""
+        """Compute the maximum inheritance chain depth.
 
-        def depth(class_name: str, visited: Set[str]) -> int:
-            if class_name not in self.inheritance_tree:
-                return 0
+        Longest path through the base -> derived graph, taken in topological
+        order so every edge is relaxed once. Classes caught in a (name-collision)
+        cycle are never released from the queue and simply stop the chain.
+        """
 
-            max_d = 0
-            for child in self.inheritance_tree[class_name]:
-                if child in visited:
-                    continue
-                visited.add(child)
-                max_d = max(max_d, 1 + depth(child, visited))
+        tree = self.inheritance_tree
+        if not tree:
+            self.analysis.inheritance_depth = 0
+            return
 
-            return max_d
+        in_degree = Counter(chain.from_iterable(tree.values()))
 
-        max_depth = 0
-        for base in self.inheritance_tree:
-            max_depth = max(max_depth, depth(base, set()))
+        depths = {name: 0 for name in tree if not in_degree[name]}
+        ready = list(depths)
 
-        self.analysis.inheritance_depth = max_depth
+        while ready:
+            name = ready.pop()
+            child_depth = depths[name] + 1
+            for child in tree.get(name, ()):
+                if child_depth > depths.get(child, 0):
+                    depths[child] = child_depth
+                in_degree[child] -= 1
+                if not in_degree[child]:
+                    ready.append(child)
 
-    def _detect_design_patterns(self):
-        """Detect common design patterns in the code."""
+        self.analysis.inheritance_depth = max(depths.values(), default=0)
 
-        patterns = set()
+    def _detect_class_patterns(self, class_info: CppClassInfo):
+        """Record the design patterns a single class reveals on its own."""
 
-        for class_name, class_info in self.classes.items():
-            # Factory pattern
-            if "Factory" in class_name:
-                patterns.add("Factory")
+        class_name = class_info.name
 
-            # Singleton pattern (heuristic)
-            if "Singleton" in class_name or any(m["name"] in ("getInstance", "instance") for m in class_info.methods):
-                patterns.add("Singleton")
+        # Factory pattern
+        if "Factory" in class_name:
+            self._patterns.add("Factory")
 
-            # Strategy pattern
-            if class_info.is_abstract:
-                children = self.inheritance_tree.get(class_name, [])
-                if len(children) >= 2:
-                    patterns.add("Strategy")
+        # Singleton pattern (heuristic)
+        if "Singleton" in class_name or not class_info.method_names.isdisjoint(_SINGLETON_ACCESSORS):
+            self._patterns.add("Singleton")
 
-            if "Observer" in class_name or "Observable" in class_name:
-                patterns.add("Observer")
+        if "Observer" in class_name or "Observable" in class_name:
+            self._patterns.add("Observer")
 
-        self.analysis.design_patterns = sorted(list(patterns))
+    def _detect_design_patterns(self):
+        """Detect patterns that depend on the whole hierarchy and publish the result."""
+
+        # Strategy pattern: an abstract class with several implementations
+        for class_name in self.analysis.abstract_classes:
+            if len(self.inheritance_tree.get(class_name, [])) >= 2:
+                self._patterns.add("Strategy")
+                break
+
+        self.analysis.design_patterns = sorted(self._patterns)
 
 
 # SCORING FUNCTIONS
@@ -433,14 +533,101 @@ def get_coding_style(oop_score: int) -> str:
         return "Advanced OOP"
 
 
+def _cache_key(content: Union[str, bytes]) -> Optional[bytes]:
+    """Digest of a source for the result cache, or None if it is too large to cache."""
+    data = content if isinstance(content, bytes) else content.encode("utf-8", errors="surrogatepass")
+    if len(data) > _ANALYSIS_CACHE_MAX_BYTES:
+        return None
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _cache_get(key: Optional[bytes]) -> Optional[CppOOPAnalysis]:
+    """Look up a cached result, marking it as recently used."""
+    if key is None:
+        return None
+    with _ANALYSIS_CACHE_LOCK:
+        cached = _ANALYSIS_CACHE.get(key)
+        if cached is not None:
+            _ANALYSIS_CACHE.move_to_end(key)
+    return cached
+
+
+def _cache_put(key: Optional[bytes], result: CppOOPAnalysis) -> None:
+    """Store a result, evicting the least recently used entry when full."""
+    if key is None:
+        return
+    with _ANALYSIS_CACHE_LOCK:
+        _ANALYSIS_CACHE[key] = result
+        if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_SIZE:
+            _ANALYSIS_CACHE.popitem(last=False)
+
+
 def analyze_cpp_file(content: str) -> CppOOPAnalysis:
-    """Analyze a single C++ file and return the OOP analysis results."""
-    analyzer = CppOOPAnalyzer()
-    return analyzer.analyze_file(content)
+    """Analyze a single C++ file and return the OOP analysis results.
+
+    Results are cached on a digest of the content, so identical sources are
+    only parsed once. The caller receives its own copy.
+    """
+    key = _cache_key(content)
+    analysis = _cache_get(key)
+    if analysis is None:
+        analysis = _analyze_cpp_job(("temp.cpp", content))
+        _cache_put(key, analysis)
+    return replace(analysis, abstract_classes=list(analysis.abstract_classes), design_patterns=list(analysis.design_patterns))
+
+
+def _analyze_cpp_job(job: Tuple[str, Union[str, bytes]]) -> CppOOPAnalysis:
+    """Process-pool entry point: analyze one (filename, content) job."""
+    filename, content = job
+    return CppOOPAnalyzer().analyze_file(content, filename)
+
+
+def _analyze_in_pool(jobs: List[Tuple[str, bytes]]) -> Optional[List[CppOOPAnalysis]]:
+    """Parse translation units across worker processes; returns None if a pool cannot be used."""
+    try:
+        with ProcessPoolExecutor() as executor:
+            return list(executor.map(_analyze_cpp_job, jobs, chunksize=_PARALLEL_CHUNKSIZE))
+    except (OSError, RuntimeError, BrokenProcessPool) as e:
+        logger.warning("Parallel C++ analysis unavailable, falling back to serial: %s", e)
+        return None
+
+
+def _merge_analysis(combined: CppOOPAnalysis, file_analysis: CppOOPAnalysis) -> None:
+    """Fold one file's analysis into the project-wide totals."""
+    combined.total_classes += file_analysis.total_classes
+    combined.struct_count += file_analysis.struct_count
+    combined.classes_with_inheritance += file_analysis.classes_with_inheritance
+    combined.inheritance_depth = max(combined.inheritance_depth, file_analysis.inheritance_depth)
+
+    combined.private_methods += file_analysis.private_methods
+    combined.protected_methods += file_analysis.protected_methods
+    combined.public_methods += file_analysis.public_methods
+
+    combined.private_fields += file_analysis.private_fields
+    combined.protected_fields += file_analysis.protected_fields
+    combined.public_fields += file_analysis.public_fields
+
+    combined.virtual_methods += file_analysis.virtual_methods
+    combined.override_methods += file_analysis.override_methods
+    combined.operator_overloads += file_analysis.operator_overloads
+
+    combined.template_classes += file_analysis.template_classes
+    combined.namespaces_used += file_analysis.namespaces_used
+
+    combined.abstract_classes.extend(file_analysis.abstract_classes)
+
+    for p in file_analysis.design_patterns:
+        if p not in combined.design_patterns:
+            combined.design_patterns.append(p)
 
 
 def analyze_cpp_project(zip_path: Path, project_path: str = "") -> Dict:
-    """Perform deep OOP analysis on a C++ project inside a ZIP file."""
+    """Perform deep OOP analysis on a C++ project inside a ZIP file.
+
+    Larger projects are parsed across one worker process per CPU; small
+    ones, or environments where a process pool cannot start, are parsed
+    serially.
+    """
     if MetadataExtractor is None or FileClassifier is None:
         raise ImportError("MetadataExtractor and FileClassifier are required")
 
@@ -457,40 +644,34 @@ def analyze_cpp_project(zip_path: Path, project_path: str = "") -> Dict:
         if "cpp" in classification["files"]["code"]:
             cpp_files = classification["files"]["code"]["cpp"]
 
+        jobs = []
         for file_info in cpp_files:
             try:
-                content = zf.read(file_info["path"]).decode("utf-8", errors="ignore")
-                file_analysis = analyze_cpp_file(content)
-
-                combined.total_classes += file_analysis.total_classes
-                combined.struct_count += file_analysis.struct_count
-                combined.classes_with_inheritance += file_analysis.classes_with_inheritance
-                combined.inheritance_depth = max(combined.inheritance_depth, file_analysis.inheritance_depth)
-
-                combined.private_methods += file_analysis.private_methods
-                combined.protected_methods += file_analysis.protected_methods
-                combined.public_methods += file_analysis.public_methods
-
-                combined.private_fields += file_analysis.private_fields
-                combined.protected_fields += file_analysis.protected_fields
-                combined.public_fields += file_analysis.public_fields
-
-                combined.virtual_methods += file_analysis.virtual_methods
-                combined.override_methods += file_analysis.override_methods
-                combined.operator_overloads += file_analysis.operator_overloads
+                # Raw bytes go straight to libclang and the cache digest without a decode/encode round-trip
+                content = zf.read(file_info["path"])
+                jobs.append((file_info["path"], content))
+            except Exception as e:
+                logger.warning("Failed to read %s: %s", file_info["path"], e)
+                continue
 
-                combined.template_classes += file_analysis.template_classes
-                combined.namespaces_used += file_analysis.namespaces_used
+        # Identical sources (vendored copies, re-runs) are served from the cache
+        keys = [_cache_key(content) for _, content in jobs]
+        results = [_cache_get(key) for key in keys]
+        misses = [i for i, result in enumerate(results) if result is None]
 
-                combined.abstract_classes.extend(file_analysis.abstract_classes)
+        if len(misses) > _PARALLEL_MIN_FILES:
+            computed = _analyze_in_pool([jobs[i] for i in misses])
+            if computed is not None:
+                for i, result in zip(misses, computed):
+                    results[i] = result
 
-                for p in file_analysis.design_patterns:
-                    if p not in combined.design_patterns:
-                        combined.design_patterns.append(p)
+        for i in misses:
+            if results[i] is None:
+                results[i] = _analyze_cpp_job(jobs[i])
+            _cache_put(keys[i], results[i])
 
-            except Exception as e:
-                print(f"Warning: Failed to analyze {file_info['path']}: {e}")
-                continue
+        for file_analysis in results:
+            _merge_analysis(combined, file_analysis)
 
         classifier.close()
 
@@ -504,8 +685,6 @@ def analyze_cpp_project(zip_path: Path, project_path: str = "") -> Dict:
 
 # COMMAND LINE INTERFACE
 if __name__ == "__main__":
-    import sys
-
     if len(sys.argv) > 1:
         file_path = Path(sys.argv[1])
 
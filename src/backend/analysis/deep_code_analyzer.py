@@ -19,10 +19,30 @@ Analysis Phases:
 """
 
 import ast
+import contextlib
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import re
+import sqlite3
+import sys
+import threading
 import zipfile
-from dataclasses import asdict, dataclass, field
+from collections import Counter, OrderedDict, namedtuple
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, replace
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    # Optional: a native encoder for saving reports; the standard library is used without it
+    orjson = None
 
 try:
     from .metadata_extractor import MetadataExtractor
@@ -32,8 +52,117 @@ except ImportError:
     MetadataExtractor = None
     FileClassifier = None
 
-
-@dataclass
+logger = logging.getLogger(__name__)
+
+# slots=True drops the per-instance __dict__ but is only available on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Python files larger than this (uncompressed) are skipped: they are almost always generated code or data
+_MAX_SOURCE_SIZE = 2 * 1024 * 1024
+
+# Projects with more Python files than this are analyzed in a process pool
+_PARALLEL_MIN_FILES = 16
+_PARALLEL_CHUNKSIZE = 8
+# Workers per pool: the API builds reports on four threads at once, each with its own pool
+_POOL_MAX_WORKERS = 4
+
+# Class-name fragments hinting at a design pattern, matched in one case-insensitive scan
+_PATTERN_NAMES = {
+    "factory": "Factory",
+    "singleton": "Singleton",
+    "builder": "Builder",
+    "observer": "Observer",
+    "strategy": "Strategy",
+}
+_PATTERN_NAME_RE = re.compile("|".join(_PATTERN_NAMES), re.IGNORECASE)
+
+# A class statement always starts a line (after any indentation, or the byte order mark on the first line)
+_CLASS_STATEMENT = {
+    str: ("class", re.compile(r"^(?:\ufeff)?[ \t\f]*class\b", re.MULTILINE)),
+    bytes: (b"class", re.compile(rb"^(?:\xef\xbb\xbf)?[ \t\f]*class\b", re.MULTILINE)),
+}
+
+# Dunder methods that are object lifecycle hooks rather than operator overloads
+_LIFECYCLE_DUNDERS = frozenset({"__init__", "__new__", "__del__"})
+# Base names marking a class as abstract, and the node types counted as methods
+_ABSTRACT_BASES = frozenset({"ABC", "Protocol"})
+_METHOD_TYPES = frozenset({ast.FunctionDef, ast.AsyncFunctionDef})
+# The parser interns identifier names, so a decorator named ``property`` is this very object
+_PROPERTY = sys.intern("property")
+
+# OOPAnalysis counters that add up across files; inheritance depth is combined with max instead
+_SUMMED_FIELDS = (
+    "total_classes",
+    "private_methods",
+    "protected_methods",
+    "public_methods",
+    "properties_count",
+    "operator_overloads",
+    "classes_with_inheritance",
+)
+_summed_counters = attrgetter(*_SUMMED_FIELDS)
+_depth_of = attrgetter("inheritance_depth")
+
+# Statement-list fields, in reverse source order, through which a nested ClassDef can be reached
+# (module/class/function bodies, if/for/while/try blocks, except handlers and match cases)
+_BLOCK_FIELDS = ("finalbody", "orelse", "handlers", "cases", "body")
+# Node type -> the block fields it actually has, filled in as types are met; most statements have none
+_BLOCK_FIELDS_BY_TYPE: Dict[type, Tuple[str, ...]] = {}
+
+# Lexical pieces used to blank out function bodies before parsing, in a str and a bytes flavour
+_BodySyntax = namedtuple(
+    "_BodySyntax",
+    "def_line noise lexeme newline blanks comment colon continuation body quotes brackets_open brackets_close",
+)
+
+
+def _body_syntax(convert) -> _BodySyntax:
+    return _BodySyntax(
+        def_line=re.compile(convert(r"[ \t]*(?:async[ \t]+)?def[ \t]")),
+        # Single-line string literals and comments, removed before counting brackets in a def header
+        noise=re.compile(convert(r"""[rRbBuUfF]{0,2}(?:"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|\#.*""")),
+        # Every string literal (triple-quoted ones across lines) and comment, leftmost first as the tokenizer
+        # reads them; a quote left over once they are removed belongs to a string that does not close
+        lexeme=re.compile(
+            convert(
+                r"'''(?:[^'\\]|\\.|'(?!''))*'''"
+                r'|"""(?:[^"\\]|\\.|"(?!""))*"""'
+                r"|'(?:[^'\\\n]|\\.)*'"
+                r'|"(?:[^"\\\n]|\\.)*"'
+                r"|\#[^\n]*"
+            ),
+            re.DOTALL,
+        ),
+        newline=convert("\n"),
+        blanks=convert(" \t"),
+        comment=convert("#"),
+        colon=convert(":"),
+        continuation=convert("\\"),
+        body=convert("pass"),
+        quotes=(convert('"'), convert("'")),
+        brackets_open=tuple(convert(c) for c in "([{"),
+        brackets_close=tuple(convert(c) for c in ")]}"),
+    )
+
+
+_BODY_SYNTAX = {str: _body_syntax(str), bytes: _body_syntax(lambda text: text.encode("ascii"))}
+
+# LRU of per-file results keyed by a digest of the source, so identical content is analyzed once.
+# Bump the version whenever the analysis changes, so stale results are never served.
+_ANALYZER_VERSION = b"3"
+_ANALYSIS_CACHE_SIZE = 4096
+_ANALYSIS_CACHE: "OrderedDict[bytes, OOPAnalysis]" = OrderedDict()
+# The API analyzes projects on several threads; reordering and eviction must not interleave
+_ANALYSIS_CACHE_LOCK = threading.Lock()
+
+# Optional SQLite file that keeps per-file results across runs, under the same keys; off unless this is set
+_PERSISTENT_CACHE_ENV = "DEEP_CODE_CACHE_PATH"
+# Per thread, (process id, database path, connection) as ``entry``: SQLite connections must not be
+# shared across a fork, and by default refuse to be used from any thread but the one that opened them
+_persistent_cache = threading.local()
+
+
+@dataclass(**_SLOTS)
 class OOPAnalysis:
     # Abstraction
     abstract_classes: List[str] = field(default_factory=list)
@@ -61,7 +190,23 @@ class OOPAnalysis:
 
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
-        return asdict(self)
+        # Spelled out rather than asdict(), which deep-copies every field reflectively
+        return {
+            "abstract_classes": list(self.abstract_classes),
+            "total_classes": self.total_classes,
+            "private_methods": self.private_methods,
+            "protected_methods": self.protected_methods,
+            "public_methods": self.public_methods,
+            "properties_count": self.properties_count,
+            "method_overrides": self.method_overrides,
+            "operator_overloads": self.operator_overloads,
+            "inheritance_depth": self.inheritance_depth,
+            "classes_with_inheritance": self.classes_with_inheritance,
+            "design_patterns": list(self.design_patterns),
+            "oop_score": self.oop_score,
+            "solid_score": self.solid_score,
+            "project_size": self.project_size,
+        }
 
 
 def detect_python_design_patterns(classes: Dict[str, ast.ClassDef]) -> List[str]:
@@ -70,318 +215,774 @@ def detect_python_design_patterns(classes: Dict[str, ast.ClassDef]) -> List[str]
     """
     patterns = set()
     for class_name in classes:
-        if "factory" in class_name.lower():
-            patterns.add("Factory")
-        if "singleton" in class_name.lower():
-            patterns.add("Singleton")
-        if "builder" in class_name.lower():
-            patterns.add("Builder")
-        if "observer" in class_name.lower():
-            patterns.add("Observer")
-        if "strategy" in class_name.lower():
-            patterns.add("Strategy")
-    return sorted(list(patterns))
+        # findall, not search: one name can hint at several patterns (e.g. SingletonFactory)
+        for match in _PATTERN_NAME_RE.findall(class_name):
+            patterns.add(_PATTERN_NAMES[match.lower()])
+    return sorted(patterns)
+
+
+def _size_tier(total_classes: int) -> str:
+    """Project size label used to pick scoring thresholds."""
+    if total_classes < 3:
+        return "small"
+    if total_classes < 10:
+        return "medium"
+    return "large"
+
+
+def _banded_points(ratio: float, count: int, ratio_bands: Tuple, count_bands: Tuple) -> float:
+    """Points for the first (threshold, points) band met, trying ratio bands before count bands."""
+    for threshold, points in ratio_bands:
+        if ratio >= threshold:
+            return points
+    for threshold, points in count_bands:
+        if count >= threshold:
+            return points
+    return 0
+
+
+# Per-size-tier thresholds for calculate_python_oop_score. Counts are integers, so "> n" is written as ">= n + 1".
+_OOP_THRESHOLDS = {
+    "small": {"abs_hi": 0.0, "abs_lo": 0.0, "depth_hi": 1, "depth_lo": 1, "private_hi": 0.4},
+    "medium": {"abs_hi": 0.15, "abs_lo": 0.0, "depth_hi": 2, "depth_lo": 1, "private_hi": 0.5, "poly_hi": 0.12, "poly_lo": 0.0},
+    "large": {"abs_hi": 0.2, "abs_lo": 0.1, "depth_hi": 3, "depth_lo": 2, "private_hi": 0.6, "poly_hi": 0.18, "poly_lo": 0.08},
+}
+
+# Per-size-tier thresholds for calculate_python_solid_score; bands are (threshold, points), best first
+_SOLID_THRESHOLDS = {
+    "small": {
+        "srp_bands": ((1, 20, 1.0),),
+        "srp_floor": 0.5,
+        "ocp_ratio": (),
+        "ocp_count": ((1, 1.0),),
+        "lsp_hi": 0.5,
+        "isp_ratio": (),
+        "isp_count": ((1, 1.0),),
+        "dip_props": 1,
+    },
+    "medium": {
+        "srp_bands": ((3, 15, 1.0), (1, 25, 0.7)),
+        "srp_floor": 0.3,
+        "ocp_ratio": ((0.18, 1.0), (0.1, 0.7)),
+        "ocp_count": ((1, 0.4),),
+        "lsp_hi": 0.7,
+        "isp_ratio": (),
+        "isp_count": ((2, 1.0), (1, 0.5)),
+        "dip_props": 2,
+    },
+    "large": {
+        "srp_bands": ((4, 12, 1.0), (2, 18, 0.7)),
+        "srp_floor": 0.3,
+        "ocp_ratio": ((0.25, 1.0), (0.15, 0.7)),
+        "ocp_count": ((3, 0.5), (1, 0.3)),
+        "lsp_hi": 1.0,
+        "isp_ratio": ((0.3, 1.0), (0.18, 0.7)),
+        "isp_count": ((4, 0.5), (1, 0.3)),
+        "dip_props": 3,
+    },
+}
 
 
 def calculate_python_oop_score(analysis: OOPAnalysis) -> int:
 
-    score = 0
     total_classes = analysis.total_classes
-    is_small = total_classes < 3
-    is_medium = 3 <= total_classes < 10
-    is_large = total_classes >= 10
+    tier = _size_tier(total_classes)
+    t = _OOP_THRESHOLDS[tier]
+    private = analysis.private_methods + analysis.protected_methods
+    total_methods = private + analysis.public_methods
+    abstraction_count = len(analysis.abstract_classes)
+    depth = analysis.inheritance_depth
+    overloads = analysis.operator_overloads
+    properties = analysis.properties_count
 
     # 1.no of classes
-    if total_classes > 0:
-        score += 1
+    score = 1 if total_classes > 0 else 0
 
     # 2.abstractions
-    abstraction_count = len(analysis.abstract_classes)
-    if is_small:
-        if abstraction_count > 0:
+    if abstraction_count > 0:
+        abstraction_ratio = abstraction_count / total_classes if total_classes else float(abstraction_count)
+        if abstraction_ratio >= t["abs_hi"]:
             score += 1
-    elif is_medium:
-        abstraction_ratio = abstraction_count / max(total_classes, 1)
-        if abstraction_ratio >= 0.15:
-            score += 1
-        elif abstraction_ratio > 0:
-            score += 0.5
-    else:
-        abstraction_ratio = abstraction_count / max(total_classes, 1)
-        if abstraction_ratio >= 0.2:
-            score += 1
-        elif abstraction_ratio >= 0.1:
+        elif abstraction_ratio >= t["abs_lo"]:
             score += 0.5
 
     # inheritance
-    if is_small:
-        if analysis.inheritance_depth > 0:
-            score += 1
-    elif is_medium:
-        if analysis.inheritance_depth >= 2:
-            score += 1
-        elif analysis.inheritance_depth > 0:
-            score += 0.5
-    else:
-        if analysis.inheritance_depth >= 3:
-            score += 1
-        elif analysis.inheritance_depth > 1:
-            score += 0.5
+    if depth >= t["depth_hi"]:
+        score += 1
+    elif depth >= t["depth_lo"]:
+        score += 0.5
 
     # encapsulation
-    total_methods = analysis.private_methods + analysis.protected_methods + analysis.public_methods
-    if total_methods > 0:
-        private_ratio = (analysis.private_methods + analysis.protected_methods) / total_methods
-        if is_small and private_ratio >= 0.4:
-            score += 1
-        elif is_medium and private_ratio >= 0.5:
-            score += 1
-        elif is_large and private_ratio >= 0.6:
-            score += 1
-        elif private_ratio > 0:
-            score += 0.5
+    if total_methods > 0 and private > 0:
+        score += 1 if private / total_methods >= t["private_hi"] else 0.5
 
     # polymorphism
-    if is_small:
-        if analysis.operator_overloads > 0:
+    if tier == "small":
+        if overloads > 0:
             score += 1
-    if is_small and (analysis.properties_count > 0 or analysis.operator_overloads > 0):
-        score = max(score, 1)
-    elif is_medium:
-        if total_methods > 0:
-            poly_ratio = analysis.operator_overloads / total_methods
-            if poly_ratio >= 0.12:
-                score += 1
-            elif analysis.operator_overloads > 0:
-                score += 0.5
-        elif analysis.operator_overloads > 0:
-            score += 0.5
-    else:
-        if total_methods > 0:
-            poly_ratio = analysis.operator_overloads / total_methods
-            if poly_ratio >= 0.18:
-                score += 1
-            elif poly_ratio >= 0.08:
-                score += 0.5
-        elif analysis.operator_overloads > 0:
-            score += 0.5
-    advanced = 0
-    if analysis.properties_count > 0:
-        advanced += 1
-    if analysis.design_patterns:
-        advanced += 1
-    if is_small:
-        if advanced > 0 and not (analysis.properties_count > 0 or analysis.operator_overloads > 0):
+        if properties > 0 or overloads > 0:
+            score = max(score, 1)
+    elif total_methods > 0:
+        poly_ratio = overloads / total_methods
+        if poly_ratio >= t["poly_hi"]:
             score += 1
-    elif is_medium:
-        if advanced >= 2:
-            score += 1
-        elif advanced > 0:
+        elif overloads > 0 and poly_ratio >= t["poly_lo"]:
             score += 0.5
-    else:  # large
-        if advanced >= 2:
+    elif overloads > 0:
+        score += 0.5
+
+    # advanced features
+    advanced = (properties > 0) + bool(analysis.design_patterns)
+    if tier == "small":
+        if advanced > 0 and not (properties > 0 or overloads > 0):
             score += 1
-        elif advanced > 0:
-            score += 0.5
+    elif advanced >= 2:
+        score += 1
+    elif advanced > 0:
+        score += 0.5
 
     return min(int(round(score)), 6)
 
 
 def calculate_python_solid_score(analysis: OOPAnalysis) -> float:
-    score = 0.0
     total_classes = analysis.total_classes
-    is_small = total_classes < 3
-    is_medium = 3 <= total_classes < 10
-    is_large = total_classes >= 10
+    t = _SOLID_THRESHOLDS[_size_tier(total_classes)]
+    abstraction_count = len(analysis.abstract_classes)
+    abstraction_ratio = abstraction_count / total_classes if total_classes else float(abstraction_count)
+    with_inheritance = analysis.classes_with_inheritance
+    overloads = analysis.operator_overloads
+    properties = analysis.properties_count
+    score = 0.0
 
     # srp
-    total_methods = analysis.private_methods + analysis.protected_methods + analysis.public_methods
     if total_classes > 0:
-        avg_methods = total_methods / max(total_classes, 1)
-        if is_small:
-            if 1 <= avg_methods <= 20:
-                score += 1.0
-            elif avg_methods > 0:
-                score += 0.5
-        elif is_medium:
-            if 3 <= avg_methods <= 15:
-                score += 1.0
-            elif 1 <= avg_methods <= 25:
-                score += 0.7
-            elif avg_methods > 0:
-                score += 0.3
-        else:  # large
-            if 4 <= avg_methods <= 12:
-                score += 1.0
-            elif 2 <= avg_methods <= 18:
-                score += 0.7
-            elif avg_methods > 0:
-                score += 0.3
+        total_methods = analysis.private_methods + analysis.protected_methods + analysis.public_methods
+        avg_methods = total_methods / total_classes
+        for low, high, points in t["srp_bands"]:
+            if low <= avg_methods <= high:
+                score += points
+                break
+        else:
+            if avg_methods > 0:
+                score += t["srp_floor"]
 
     # open closed
-    abstraction_count = len(analysis.abstract_classes)
-    if is_small:
-        if abstraction_count > 0:
-            score += 1.0
-    elif is_medium:
-        abstraction_ratio = abstraction_count / max(total_classes, 1)
-        if abstraction_ratio >= 0.18:
-            score += 1.0
-        elif abstraction_ratio >= 0.1:
-            score += 0.7
-        elif abstraction_count > 0:
-            score += 0.4
-    else:  # large
-        abstraction_ratio = abstraction_count / max(total_classes, 1)
-        if abstraction_ratio >= 0.25:
-            score += 1.0
-        elif abstraction_ratio >= 0.15:
-            score += 0.7
-        elif abstraction_count >= 3:
-            score += 0.5
-        elif abstraction_count > 0:
-            score += 0.3
+    score += _banded_points(abstraction_ratio, abstraction_count, t["ocp_ratio"], t["ocp_count"])
 
     # liskovs
-    if analysis.classes_with_inheritance > 0:
-        override_ratio = analysis.operator_overloads / max(analysis.classes_with_inheritance, 1)
-        if is_small and override_ratio >= 0.5:
-            score += 1.0
-        elif is_medium and override_ratio >= 0.7:
-            score += 1.0
-        elif is_large and override_ratio >= 1.0:
+    if with_inheritance > 0:
+        if overloads / with_inheritance >= t["lsp_hi"]:
             score += 1.0
-        elif analysis.operator_overloads > 0:
+        elif overloads > 0:
             score += 0.5
         else:
             score += 0.3
 
     # interfaces
-    if is_small:
-        if abstraction_count > 0:
-            score += 1.0
-    elif is_medium:
-        if abstraction_count >= 2:
-            score += 1.0
-        elif abstraction_count > 0:
-            score += 0.5
-    else:  # large
-        abstraction_ratio = abstraction_count / max(total_classes, 1)
-        if abstraction_ratio >= 0.3:
-            score += 1.0
-        elif abstraction_ratio >= 0.18:
-            score += 0.7
-        elif abstraction_count >= 4:
-            score += 0.5
-        elif abstraction_count > 0:
-            score += 0.3
+    score += _banded_points(abstraction_ratio, abstraction_count, t["isp_ratio"], t["isp_count"])
 
     # dependence inversions
-    if is_small and analysis.properties_count > 0:
-        score += 1.0
-    elif is_medium and analysis.properties_count > 1:
+    if properties >= t["dip_props"]:
         score += 1.0
-    elif is_large and analysis.properties_count > 2:
-        score += 1.0
-    elif analysis.properties_count > 0:
+    elif properties > 0:
         score += 0.5
 
     return min(score, 5.0)
 
 
-class PythonOOPAnalyzer(ast.NodeVisitor):
-    def __init__(self):
+class PythonOOPAnalyzer:
+    def __init__(self) -> None:
         self.analysis = OOPAnalysis()
-        self.classes: Dict[str, ast.ClassDef] = {}
         self.current_class: Optional[str] = None
-
-    def _analyze_method(self, node: ast.FunctionDef):
+        # Facts gathered while visiting, so no later pass re-walks or holds on to the class nodes:
+        # every class name mapped to its plain-name bases, and the classes declaring any base at all
+        self.base_names: Dict[str, Tuple[str, ...]] = {}
+        self.derived_classes: Set[str] = set()
+        self.design_patterns: Set[str] = set()
+
+    def visit(self, node: ast.AST) -> None:
+        """Visit every class definition under ``node`` in source order.
+
+        Only ClassDef nodes carry OOP facts, and a class definition is a
+        statement, so instead of a generic per-node visitor over the whole
+        tree only statement blocks are walked (with an explicit stack);
+        expression subtrees, the bulk of any module, are never entered.
+        """
+        fields_by_type = _BLOCK_FIELDS_BY_TYPE
+        class_def = ast.ClassDef
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            node_type = type(current)
+            if node_type is class_def:
+                self.visit_ClassDef(current)
+            block_fields = fields_by_type.get(node_type)
+            if block_fields is None:
+                block_fields = fields_by_type[node_type] = tuple(f for f in _BLOCK_FIELDS if f in node_type._fields)
+            # Pushed in reverse so blocks, and statements within them, pop in source order
+            for block_field in block_fields:
+                block = getattr(current, block_field)
+                if block:
+                    stack.extend(reversed(block))
+
+    def _analyze_method(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> None:
+        analysis = self.analysis
         method_name = node.name
-        if method_name.startswith("__") and not method_name.endswith("__"):
-            self.analysis.private_methods += 1
-        elif method_name.startswith("_"):
-            self.analysis.protected_methods += 1
+        # Classify from the leading/trailing underscores, each looked at once; public names, the
+        # most common, are settled by the first comparison, which a lookup table keyed on all the
+        # underscore tests would not beat
+        if method_name[:1] != "_":
+            analysis.public_methods += 1
+        elif method_name[:2] != "__":
+            analysis.protected_methods += 1
+        elif method_name[-2:] != "__":
+            analysis.private_methods += 1
         else:
-            self.analysis.public_methods += 1
-
-        for decorator in node.decorator_list:
-            if isinstance(decorator, ast.Name) and decorator.id == "property":
-                self.analysis.properties_count += 1
-
-        if method_name.startswith("__") and method_name.endswith("__"):
-            if method_name not in ("__init__", "__new__", "__del__"):
-                self.analysis.operator_overloads += 1
-
-    def visit_ClassDef(self, node: ast.ClassDef):
-        self.classes[node.name] = node
+            # Dunder methods count as protected; all but the lifecycle hooks are operator overloads
+            analysis.protected_methods += 1
+            if method_name not in _LIFECYCLE_DUNDERS:
+                analysis.operator_overloads += 1
+
+        if node.decorator_list:
+            name_type = ast.Name
+            for decorator in node.decorator_list:
+                if type(decorator) is name_type and decorator.id is _PROPERTY:
+                    analysis.properties_count += 1
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
         self.analysis.total_classes += 1
 
-        for base in node.bases:
-            if isinstance(base, ast.Name) and base.id in ("ABC", "Protocol"):
-                self.analysis.abstract_classes.append(node.name)
-                break
-        if len(node.bases) > 0:
+        name_type = ast.Name
+        base_names = tuple(base.id for base in node.bases if type(base) is name_type)
+        self.base_names[node.name] = base_names
+        if not _ABSTRACT_BASES.isdisjoint(base_names):
+            self.analysis.abstract_classes.append(node.name)
+        # A redefinition replaces the earlier class of the same name, as it does at runtime
+        if node.bases:
             self.analysis.classes_with_inheritance += 1
+            self.derived_classes.add(node.name)
+        else:
+            self.derived_classes.discard(node.name)
+
+        for match in _PATTERN_NAME_RE.findall(node.name):
+            self.design_patterns.add(_PATTERN_NAMES[match.lower()])
 
         # Analyze methods
         old_class = self.current_class
         self.current_class = node.name
 
+        method_types, analyze_method = _METHOD_TYPES, self._analyze_method
         for item in node.body:
-            if isinstance(item, ast.FunctionDef):
-                self._analyze_method(item)
+            if type(item) in method_types:
+                analyze_method(item)
 
         self.current_class = old_class
-        self.generic_visit(node)
-
-    def calculate_inheritance_depth(self):
-        def get_depth(class_name: str, visited: Set[str] = None) -> int:
-            if visited is None:
-                visited = set()
 
-            if class_name in visited or class_name not in self.classes:
+    def calculate_inheritance_depth(self) -> None:
+        base_names = self.base_names
+        derived_classes = self.derived_classes
+        # Common cases settled without a walk: nothing inherits, or only from classes defined elsewhere
+        if not any(base in base_names for class_name in derived_classes for base in base_names[class_name]):
+            self.analysis.inheritance_depth = 1 if derived_classes else 0
+            return
+
+        # Three-colour marks in one dict: a class is unvisited while absent, on the current path while
+        # marked on_path, and done once it holds its depth. Reaching a class on the path again is an
+        # inheritance cycle, which stops there.
+        on_path = -1
+        depths: Dict[str, int] = {}
+
+        def known_depth(class_name: str) -> Optional[int]:
+            """Depth without descending further, or None if the class's bases must be walked first."""
+            if class_name not in base_names:
                 return 0
+            depth = depths.get(class_name)
+            if depth is None:
+                if class_name not in derived_classes:
+                    depth = depths[class_name] = 0
+            elif depth == on_path:
+                return 0
+            return depth
 
-            visited.add(class_name)
-            node = self.classes[class_name]
+        # Depth-first over the base edges with an explicit stack, so deep hierarchies cannot hit the
+        # recursion limit. Each frame is [class name, its remaining bases, deepest base seen so far].
+        for root in base_names:
+            if known_depth(root) is not None:
+                continue
+            depths[root] = on_path
+            stack = [[root, iter(base_names[root]), 0]]
+            while stack:
+                frame = stack[-1]
+                for base in frame[1]:
+                    depth = known_depth(base)
+                    if depth is None:
+                        depths[base] = on_path
+                        stack.append([base, iter(base_names[base]), 0])
+                        break
+                    if depth > frame[2]:
+                        frame[2] = depth
+                else:
+                    stack.pop()
+                    depth = depths[frame[0]] = frame[2] + 1
+                    if stack and depth > stack[-1][2]:
+                        stack[-1][2] = depth
 
-            if not node.bases:
-                return 0
+        self.analysis.inheritance_depth = max(depths.values(), default=0)
 
-            max_depth = 0
-            for base in node.bases:
-                if isinstance(base, ast.Name):
-                    depth = get_depth(base.id, visited.copy())
-                    max_depth = max(max_depth, depth)
 
-            return max_depth + 1
+def _cache_key(content: Union[str, bytes]) -> bytes:
+    """Digest of a source, salted with the analyzer version, for the result cache."""
+    digest = hashlib.blake2b(_ANALYZER_VERSION, digest_size=16)
+    digest.update(content if isinstance(content, bytes) else content.encode("utf-8", errors="surrogatepass"))
+    return digest.digest()
 
-        max_depth = 0
-        for class_name in self.classes:
-            depth = get_depth(class_name)
-            max_depth = max(max_depth, depth)
 
-        self.analysis.inheritance_depth = max_depth
+def _get_persistent_cache() -> Optional[sqlite3.Connection]:
+    """This thread's connection to the on-disk result cache, or None when it is disabled or cannot be opened."""
+    path = os.getenv(_PERSISTENT_CACHE_ENV)
+    if not path:
+        return None
+    pid = os.getpid()
+    entry = getattr(_persistent_cache, "entry", None)
+    if entry is not None and entry[:2] == (pid, path):
+        return entry[2]
 
+    try:
+        db_path = Path(path).expanduser()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(db_path, timeout=30)
+        # WAL lets pool workers read while another one writes
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS oop_analysis (digest BLOB PRIMARY KEY, analysis TEXT NOT NULL)")
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Persistent OOP analysis cache unavailable at %s: %s", path, e)
+        return None
+    _persistent_cache.entry = (pid, path, conn)
+    return conn
+
+
+def _load_persistent(key: bytes) -> Optional[OOPAnalysis]:
+    conn = _get_persistent_cache()
+    if conn is None:
+        return None
+    try:
+        row = conn.execute("SELECT analysis FROM oop_analysis WHERE digest = ?", (key,)).fetchone()
+        # Stored as JSON rather than pickled, so a tampered cache file cannot run code
+        return OOPAnalysis(**json.loads(row[0])) if row else None
+    except (sqlite3.Error, ValueError, TypeError) as e:
+        logger.warning("Ignoring unreadable persistent cache entry: %s", e)
+        return None
+
+
+def _store_persistent(key: bytes, analysis: OOPAnalysis) -> None:
+    conn = _get_persistent_cache()
+    if conn is None:
+        return
+    try:
+        with conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO oop_analysis (digest, analysis) VALUES (?, ?)", (key, json.dumps(analysis.to_dict()))
+            )
+    except sqlite3.Error as e:
+        logger.warning("Could not write persistent cache entry: %s", e)
 
-def analyze_python_file(content: str) -> OOPAnalysis:
-    """
-    Analyze a single Python file for OOP principles and design patterns.
+
+def _parse_source(content: Union[str, bytes]) -> ast.Module:
+    # Same as ast.parse, minus its wrapper call and without inheriting this module's future flags
+    return compile(content, "<unknown>", "exec", flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+
+
+def _strip_function_bodies(content: Union[str, bytes]) -> Tuple[Union[str, bytes], List[int]]:
+    """Replace function bodies that cannot hold a class definition with ``pass``.
+
+    Only class statements, base lists, method names and decorators feed the
+    analysis, while function bodies are most of what the parser has to build.
+    Working line by line on indentation, a body is blanked only when none of
+    its lines starts with ``class`` and it closes every string, bracket and
+    line continuation it opens, so the lines after it read the same.
+
+    Returns:
+        The source (the original object if nothing was blanked) and the line
+        numbers, in the returned source, of the defs whose bodies were blanked
     """
+    syntax = _BODY_SYNTAX[type(content)]
+    class_statement = _CLASS_STATEMENT[type(content)][1]
+    blanks, comment = syntax.blanks, syntax.comment
+    empty = content[:0]
+    lines = content.split(syntax.newline)
+    line_count = len(lines)
+    out = []
+    blanked = []
+    i = 0
+    while i < line_count:
+        line = lines[i]
+        if syntax.def_line.match(line) is None:
+            out.append(line)
+            i += 1
+            continue
+
+        # The header runs from the def line until its brackets balance, and must end in a colon
+        indent_len = len(line) - len(line.lstrip(blanks))
+        indent = line[:indent_len]
+        depth = 0
+        header_end = i
+        while True:
+            code = syntax.noise.sub(empty, lines[header_end])
+            depth += sum(code.count(bracket) for bracket in syntax.brackets_open)
+            depth -= sum(code.count(bracket) for bracket in syntax.brackets_close)
+            if depth <= 0 or header_end + 1 == line_count:
+                break
+            header_end += 1
+        def_line_number = len(out) + 1
+        out.extend(lines[i : header_end + 1])
+        i = header_end + 1
+        if depth != 0 or not code.rstrip().endswith(syntax.colon):
+            continue
+
+        # The body is every following line indented deeper than the def; blank and comment-only lines never end it
+        first_body = last_body = None
+        j = i
+        while j < line_count:
+            body_line = lines[j]
+            text = body_line.lstrip(blanks)
+            if not text.strip() or text.startswith(comment):
+                j += 1
+            elif body_line.startswith(indent) and len(body_line) - len(text) > indent_len:
+                if first_body is None:
+                    first_body = j
+                last_body = j
+                j += 1
+            else:
+                break
+        if first_body is None:
+            continue
+        body = syntax.newline.join(lines[i : last_body + 1])
+        if class_statement.search(body):
+            continue
+        code = syntax.lexeme.sub(empty, body)
+        if code.rstrip().endswith(syntax.continuation) or any(quote in code for quote in syntax.quotes):
+            continue
+        if sum(code.count(bracket) for bracket in syntax.brackets_open) != sum(
+            code.count(bracket) for bracket in syntax.brackets_close
+        ):
+            continue
+
+        first_line = lines[first_body]
+        out.append(first_line[: len(first_line) - len(first_line.lstrip(blanks))] + syntax.body)
+        blanked.append(def_line_number)
+        i = last_body + 1
+    return (syntax.newline.join(out), blanked) if blanked else (content, blanked)
+
+
+def _parse_stripped(content: Union[str, bytes]) -> Optional[ast.Module]:
+    """Parse the source with function bodies blanked, or None if that could read differently from the original."""
+    stripped, def_lines = _strip_function_bodies(content)
+    if not def_lines:
+        return None
     try:
-        tree = ast.parse(content)
-        analyzer = PythonOOPAnalyzer()
-        analyzer.visit(tree)
-        analyzer.calculate_inheritance_depth()
-        analyzer.analysis.design_patterns = detect_python_design_patterns(analyzer.classes)
-        analyzer.analysis.oop_score = calculate_python_oop_score(analyzer.analysis)
-        analyzer.analysis.solid_score = calculate_python_solid_score(analyzer.analysis)
-        return analyzer.analysis
+        tree = _parse_source(stripped)
     except SyntaxError:
+        return None
+
+    # A def line inside a string literal looks like any other to the stripper; every blanked
+    # def must come out of the parser as a function whose whole body is the inserted pass
+    unconfirmed = set(def_lines)
+    fields_by_type = _BLOCK_FIELDS_BY_TYPE
+    stack = [tree]
+    while stack:
+        current = stack.pop()
+        node_type = type(current)
+        if node_type in _METHOD_TYPES and current.lineno in unconfirmed:
+            body = current.body
+            if len(body) == 1 and type(body[0]) is ast.Pass:
+                unconfirmed.discard(current.lineno)
+        block_fields = fields_by_type.get(node_type)
+        if block_fields is None:
+            block_fields = fields_by_type[node_type] = tuple(f for f in _BLOCK_FIELDS if f in node_type._fields)
+        for block_field in block_fields:
+            stack.extend(getattr(current, block_field) or ())
+    return None if unconfirmed else tree
+
+
+def _analyze_source(content: Union[str, bytes]) -> OOPAnalysis:
+    tree = _parse_stripped(content)
+    if tree is None:
+        candidates = [content]
+        if isinstance(content, bytes):
+            # Raw bytes that are not valid in their declared encoding: drop the bad bytes, as decoding would
+            candidates.append(content.decode("utf-8", errors="ignore"))
+        for candidate in candidates:
+            try:
+                tree = _parse_source(candidate)
+                break
+            except SyntaxError:
+                continue
+        else:
+            return OOPAnalysis()
+    analyzer = PythonOOPAnalyzer()
+    analyzer.visit(tree)
+    analyzer.calculate_inheritance_depth()
+    analyzer.analysis.design_patterns = sorted(analyzer.design_patterns)
+    analyzer.analysis.oop_score = calculate_python_oop_score(analyzer.analysis)
+    analyzer.analysis.solid_score = calculate_python_solid_score(analyzer.analysis)
+    return analyzer.analysis
+
+
+def _cached_analysis(content: Union[str, bytes]) -> OOPAnalysis:
+    """The analysis of one source, shared with the result cache; callers must not mutate it."""
+    # Without a class statement there is nothing to find; a substring scan rejects most such files even
+    # more cheaply, and the line-anchored search catches the rest (classify(), __class__, docstrings)
+    keyword, class_statement = _CLASS_STATEMENT[type(content)]
+    if keyword not in content or not class_statement.search(content):
         return OOPAnalysis()
 
+    key = _cache_key(content)
+    with _ANALYSIS_CACHE_LOCK:
+        analysis = _ANALYSIS_CACHE.get(key)
+        if analysis is not None:
+            _ANALYSIS_CACHE.move_to_end(key)
+            return analysis
+    # Parsed outside the lock, so other threads are not held up; a source analyzed by two threads at
+    # once is stored twice with equal results
+    analysis = _load_persistent(key)
+    if analysis is None:
+        analysis = _analyze_source(content)
+        _store_persistent(key, analysis)
+    with _ANALYSIS_CACHE_LOCK:
+        _ANALYSIS_CACHE[key] = analysis
+        if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_SIZE:
+            _ANALYSIS_CACHE.popitem(last=False)
+    return analysis
+
+
+def analyze_python_file(content: Union[str, bytes]) -> OOPAnalysis:
+    """
+    Analyze a single Python file for OOP principles and design patterns.
+    Raw bytes are accepted and decoded by the parser itself (honouring any coding declaration).
+    Results are also kept across runs when DEEP_CODE_CACHE_PATH names a SQLite cache file.
+    """
+    analysis = _cached_analysis(content)
+    # Callers get their own copy, so mutating a result never corrupts the cache
+    return replace(analysis, abstract_classes=list(analysis.abstract_classes), design_patterns=list(analysis.design_patterns))
+
+
+def _analyze_python_job(content: Union[str, bytes]) -> Optional[OOPAnalysis]:
+    """Analyze one file for a project-wide reduction, or None if it cannot be analyzed.
+
+    The reduction only reads the result, so cache hits are handed over without a copy.
+    """
+    try:
+        return _cached_analysis(content)
+    except Exception:
+        return None
+
+
+def _readable_python_files(python_files: List[Dict]) -> Iterator[Dict]:
+    """Yield the files worth opening, skipping empty and oversized entries."""
+    for file_info in python_files:
+        # The classifier already recorded the uncompressed size, so nothing is decompressed to find it;
+        # empty files (most __init__.py modules) are not even opened
+        size = file_info.get("size")
+        if size == 0:
+            continue
+        if size is not None and size > _MAX_SOURCE_SIZE:
+            logger.info("Skipping oversized Python file %s (%d bytes)", file_info["path"], size)
+            continue
+        yield file_info
+
+
+def _read_python_source(zf: zipfile.ZipFile, path: str) -> Optional[bytes]:
+    """The raw bytes of one archive member, or None if it cannot be read."""
+    try:
+        with zf.open(path) as f:
+            return f.read()
+    except Exception:
+        return None
+
+
+def _read_python_sources(zf: zipfile.ZipFile, python_files: List[Dict]) -> Iterator[bytes]:
+    """Yield the raw bytes of each readable file, skipping empty or oversized entries and those that cannot be read."""
+    for file_info in _readable_python_files(python_files):
+        content = _read_python_source(zf, file_info["path"])
+        if content is not None:
+            yield content
 
-def analyze_project_deep(zip_path: Path, project_path: str = "") -> Dict:
+
+def _batched(contents: Iterable[bytes], size: int) -> Iterator[List[bytes]]:
+    """Group sources into lists of at most ``size``, consuming the iterable lazily."""
+    batch = []
+    for content in contents:
+        batch.append(content)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _analyze_python_batch(contents: List[bytes]) -> List[Optional[OOPAnalysis]]:
+    """Process-pool entry point: analyze a batch of files, one result per file."""
+    # Class-free files add nothing to the totals, so only None crosses the process boundary for them
+    return [
+        analysis if analysis is not None and analysis.total_classes else None for analysis in map(_analyze_python_job, contents)
+    ]
+
+
+def _map_batches(executor: Executor, contents: Iterable[bytes]) -> List[Optional[OOPAnalysis]]:
+    return [
+        analysis for batch in executor.map(_analyze_python_batch, _batched(contents, _PARALLEL_CHUNKSIZE)) for analysis in batch
+    ]
+
+
+def _analyze_in_pool(
+    contents: Iterable[bytes], file_count: int, executor: Optional[Executor] = None
+) -> Optional[List[Optional[OOPAnalysis]]]:
+    """Analyze files across worker processes, one result per file; returns None if a pool cannot be used.
+
+    A caller-owned ``executor`` is used as is (and left running); otherwise a pool is started for this call.
+    """
+    try:
+        if executor is not None:
+            return _map_batches(executor, contents)
+        # At least one full batch per worker, so small projects do not pay for idle processes
+        with _new_process_pool(file_count // _PARALLEL_CHUNKSIZE) as own_executor:
+            return _map_batches(own_executor, contents)
+    except (OSError, RuntimeError, BrokenProcessPool) as e:
+        logger.warning("Parallel OOP analysis unavailable, falling back to serial: %s", e)
+        return None
+
+
+def _new_process_pool(max_workers: int = _POOL_MAX_WORKERS) -> ProcessPoolExecutor:
+    """A process pool of at most ``max_workers`` (and no more than ``_POOL_MAX_WORKERS`` or the CPU count).
+
+    Workers are spawned rather than forked: the API calls in from worker threads, and forking a
+    multi-threaded process can leave a lock held by another thread locked forever in the child.
+    """
+    max_workers = max(1, min(max_workers, _POOL_MAX_WORKERS, os.cpu_count() or 1))
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+@contextlib.contextmanager
+def _optional_process_pool() -> Iterator[Optional[ProcessPoolExecutor]]:
+    """A process pool for the duration of the block, or None where one cannot be created.
+
+    Worker processes are only started once work is first submitted.
+    """
+    try:
+        executor = _new_process_pool()
+    except (OSError, ImportError, NotImplementedError) as e:
+        logger.warning("Process pool unavailable, analyzing serially: %s", e)
+        yield None
+        return
+    with executor:
+        yield executor
+
+
+def _reduce_analyses(analyses: Iterable[Optional[OOPAnalysis]]) -> OOPAnalysis:
+    """Combine per-file (or per-batch) analyses; totals add up, so partial results combine the same way."""
+    # Every counter is gathered inside a class body, so class-free files (scripts, tests,
+    # __init__ modules) contribute nothing to the totals
+    contributing = [file_analysis for file_analysis in analyses if file_analysis is not None and file_analysis.total_classes]
+    combined_oop = OOPAnalysis()
+    if not contributing:
+        return combined_oop
+
+    # One row of counters per file, reduced a column at a time instead of field by field per file
+    columns = zip(*map(_summed_counters, contributing))
+    for name, column in zip(_SUMMED_FIELDS, columns):
+        setattr(combined_oop, name, sum(column))
+    combined_oop.inheritance_depth = max(map(_depth_of, contributing))
+    combined_oop.abstract_classes = [name for file_analysis in contributing for name in file_analysis.abstract_classes]
+    combined_oop.design_patterns = sorted(
+        {pattern for file_analysis in contributing for pattern in file_analysis.design_patterns}
+    )
+    return combined_oop
+
+
+def _member_signatures(zf: zipfile.ZipFile, python_files: List[Dict]) -> List[Tuple[Tuple[int, int], str]]:
+    """Pair each readable file's path with the size and CRC-32 recorded in the ZIP's central directory.
+
+    Members missing from the archive cannot be opened and are left out, as when reading them.
+    """
+    signatures = []
+    for file_info in _readable_python_files(python_files):
+        try:
+            info = zf.getinfo(file_info["path"])
+        except KeyError:
+            continue
+        signatures.append(((info.file_size, info.CRC), file_info["path"]))
+    return signatures
+
+
+def _analyze_python_files(
+    zf: zipfile.ZipFile,
+    python_files: List[Dict],
+    executor: Optional[Executor] = None,
+    seen_sources: Optional[Dict[Tuple[int, int], Dict[bytes, Optional[OOPAnalysis]]]] = None,
+) -> OOPAnalysis:
+    """Analyze already-classified Python files from an open archive into one scored project analysis.
+
+    In larger projects, repeated sources are parsed once and the result counted for every copy. Files are
+    routed on the size and CRC-32 from the ZIP's central directory: a file matching no other is a new source
+    and is read lazily, while files that share the pair are read up front and told apart by the content
+    digest of the result cache. ``seen_sources`` keeps the results across calls, so files repeated between
+    projects of one archive (vendored libraries, copied modules) are not parsed again.
+    """
+    combined_oop = None
+    if len(python_files) > _PARALLEL_MIN_FILES:
+        known = {} if seen_sources is None else seen_sources
+        signatures = _member_signatures(zf, python_files)
+        copies = Counter(signature for signature, _ in signatures)
+        # One (pair, digest) key per file; a lazily read file gets its digest when it is read
+        keys: List[Optional[Tuple[Tuple[int, int], bytes]]] = []
+        # The first copy of each source not analyzed yet stands in for all of its copies, given as the
+        # path to read or the bytes already read
+        representatives: List[Tuple[int, Union[str, bytes]]] = []
+        queued: Set[Tuple[Tuple[int, int], bytes]] = set()
+        for signature, path in signatures:
+            if copies[signature] == 1 and signature not in known:
+                representatives.append((len(keys), path))
+                keys.append(None)
+                continue
+            # A member that fails to read is parsed as an empty source
+            content = _read_python_source(zf, path) or b""
+            key = (signature, _cache_key(content))
+            if key[1] not in known.get(signature, ()) and key not in queued:
+                queued.add(key)
+                representatives.append((len(keys), content))
+            keys.append(key)
+
+        def representative_contents() -> Iterator[bytes]:
+            # Files are read lazily while the pool works: the main process streams
+            # bytes out of the ZIP while workers are already parsing earlier chunks
+            for index, source in representatives:
+                if isinstance(source, str):
+                    source = _read_python_source(zf, source) or b""
+                    keys[index] = (signatures[index][0], _cache_key(source))
+                yield source
+
+        if len(representatives) > _PARALLEL_MIN_FILES:
+            results = _analyze_in_pool(representative_contents(), len(representatives), executor)
+        else:
+            results = [_analyze_python_job(content) for content in representative_contents()]
+        if results is not None:
+            for (index, _), result in zip(representatives, results):
+                signature, digest = keys[index]
+                known.setdefault(signature, {})[digest] = result
+            combined_oop = _reduce_analyses(known[signature][digest] for signature, digest in keys)
+    if combined_oop is None:
+        combined_oop = _reduce_analyses(_analyze_python_job(content) for content in _read_python_sources(zf, python_files))
+
+    # Project size label
+    combined_oop.project_size = _size_tier(combined_oop.total_classes)
+
+    # OOP and SOLID scores
+    combined_oop.oop_score = calculate_python_oop_score(combined_oop)
+    combined_oop.solid_score = calculate_python_solid_score(combined_oop)
+    return combined_oop
+
+
+def analyze_project_deep(zip_path: Path, project_path: str = "", executor: Optional[Executor] = None) -> Dict:
     """
     Perform deep OOP analysis on a Python project in a ZIP file.
     This builds upon the metadata extractor's analysis.
@@ -389,6 +990,7 @@ def analyze_project_deep(zip_path: Path, project_path: str = "") -> Dict:
     Args:
         zip_path: Path to ZIP file
         project_path: Path within ZIP to analyze (empty string for root)
+        executor: Optional process pool to reuse for large projects instead of starting one per call
 
     Returns:
         Dictionary with combined metadata and OOP analysis
@@ -399,49 +1001,17 @@ def analyze_project_deep(zip_path: Path, project_path: str = "") -> Dict:
     if MetadataExtractor is None or FileClassifier is None:
         raise ImportError("MetadataExtractor and FileClassifier are required for project analysis")
 
-    # First, get basic metadata using existing MetadataExtractor
+    # One archive handle serves the metadata pass, the classifier and the file reads
     with MetadataExtractor(zip_path) as extractor:
         metadata = extractor.extract_project_metadata(project_path)
 
-    combined_oop = OOPAnalysis()
+        # The metadata pass already classified the project; only classify again if it kept no file list
+        python_files = extractor.project_python_files.get(project_path, [])
+        if not python_files and metadata.languages.get("python"):
+            classification = extractor.classifier.classify_project(project_path)
+            python_files = classification["files"]["code"].get("python", [])
 
-    with zipfile.ZipFile(zip_path, "r") as zf:
-        python_files = []
-        classifier = FileClassifier(zip_path)
-        classification = classifier.classify_project(project_path)
-        if "python" in classification["files"]["code"]:
-            python_files = classification["files"]["code"]["python"]
-        for file_info in python_files:
-            try:
-                content = zf.read(file_info["path"]).decode("utf-8", errors="ignore")
-                file_analysis = analyze_python_file(content)
-                combined_oop.total_classes += file_analysis.total_classes
-                combined_oop.abstract_classes.extend(file_analysis.abstract_classes)
-                combined_oop.private_methods += file_analysis.private_methods
-                combined_oop.protected_methods += file_analysis.protected_methods
-                combined_oop.public_methods += file_analysis.public_methods
-                combined_oop.properties_count += file_analysis.properties_count
-                combined_oop.operator_overloads += file_analysis.operator_overloads
-                combined_oop.classes_with_inheritance += file_analysis.classes_with_inheritance
-                combined_oop.inheritance_depth = max(combined_oop.inheritance_depth, file_analysis.inheritance_depth)
-                combined_oop.design_patterns.extend(
-                    [p for p in file_analysis.design_patterns if p not in combined_oop.design_patterns]
-                )
-            except Exception:
-                continue
-        classifier.close()
-
-    # Project size label
-    if combined_oop.total_classes < 3:
-        combined_oop.project_size = "small"
-    elif 3 <= combined_oop.total_classes < 10:
-        combined_oop.project_size = "medium"
-    else:
-        combined_oop.project_size = "large"
-
-    # OOP and SOLID scores
-    combined_oop.oop_score = calculate_python_oop_score(combined_oop)
-    combined_oop.solid_score = calculate_python_solid_score(combined_oop)
+        combined_oop = _analyze_python_files(extractor.zip_file, python_files, executor)
 
     # Combine results
     result = {
@@ -483,7 +1053,21 @@ def generate_comprehensive_report(
     if MetadataExtractor is None:
         raise ImportError("MetadataExtractor is required for comprehensive report")
 
-    with MetadataExtractor(zip_path, target_user_email=target_user_email) as extractor:
+    # Resolve the optional analyzers once, not per project; a failed import is reported on each project that needs it
+    try:
+        from .complexity_analyzer import analyze_project as analyze_complexity
+    except ImportError as e:
+        analyze_complexity = None
+        complexity_import_error = str(e)
+    try:
+        from .java_oop_analyzer import _analyze_java_files, analyze_java_project
+    except ImportError:
+        analyze_java_project = None
+
+    # One pool serves every large Python project in the archive, rather than one pool per project,
+    # and every phase reads files through the extractor's archive handle instead of reopening the ZIP
+    seen_sources: Dict[Tuple[int, int], Dict[bytes, Optional[OOPAnalysis]]] = {}
+    with MetadataExtractor(zip_path, target_user_email=target_user_email) as extractor, _optional_process_pool() as executor:
         # Generate base report (Phases 1 & 2)
         report = extractor.generate_report()
         # Add Phase 3: Deep OOP analysis for each Python project
@@ -492,8 +1076,14 @@ def generate_comprehensive_report(
             # Only analyze if project has Python files
             if "python" in project.get("languages", {}):
                 try:
-                    deep_analysis = analyze_project_deep(zip_path, project_path)
-                    report["projects"][i]["oop_analysis"] = deep_analysis["oop_analysis"]
+                    # generate_report already classified this project; reuse its file list rather
+                    # than extracting the whole project's metadata (git history included) again
+                    python_files = extractor.project_python_files.get(project_path)
+                    if python_files is not None:
+                        oop_analysis = _analyze_python_files(extractor.zip_file, python_files, executor, seen_sources).to_dict()
+                    else:
+                        oop_analysis = analyze_project_deep(zip_path, project_path, executor)["oop_analysis"]
+                    report["projects"][i]["oop_analysis"] = oop_analysis
                 except Exception as e:
                     # If deep analysis fails, add error info
                     report["projects"][i]["oop_analysis"] = {
@@ -503,29 +1093,30 @@ def generate_comprehensive_report(
 
                 # Phase 4: Add complexity analysis (Python & Java)
                 try:
-                    from .complexity_analyzer import \
-                        analyze_project as analyze_complexity
+                    if analyze_complexity is None:
+                        raise ImportError(complexity_import_error)
 
                     # Get Python and Java files for this project
                     code_files = []
-                    with zipfile.ZipFile(zip_path, "r") as zf:
-                        for file_info in zf.namelist():
-                            # Match Python and Java files in this project path
-                            if file_info.endswith((".py", ".java")):
-                                if not project_path or file_info.startswith(project_path):
-                                    try:
-                                        content = zf.read(file_info).decode("utf-8", errors="ignore")
-                                        code_files.append((file_info, content))
-                                    except Exception:
-                                        continue
+                    zf = extractor.zip_file
+                    for file_info in zf.namelist():
+                        # Match Python and Java files in this project path
+                        if file_info.endswith((".py", ".java")):
+                            if not project_path or file_info.startswith(project_path):
+                                try:
+                                    content = zf.read(file_info).decode("utf-8", errors="ignore")
+                                    code_files.append((file_info, content))
+                                except Exception:
+                                    continue
 
                     if code_files:
-                        complexity_report = analyze_complexity(code_files, language="auto")
+                        # Only the score and counts are stored, so skip building per-line insights
+                        complexity_report = analyze_complexity(code_files, language="auto", collect_details=False)
                         report["projects"][i]["complexity_analysis"] = {
                             "total_files_analyzed": complexity_report.total_files_analyzed,
                             "optimization_score": complexity_report.optimization_score,
                             "summary": complexity_report.summary,
-                            "insights_count": len(complexity_report.insights),
+                            "insights_count": sum(complexity_report.summary.values()),
                         }
                 except Exception as e:
                     report["projects"][i]["complexity_analysis"] = {
@@ -535,10 +1126,16 @@ def generate_comprehensive_report(
 
             if "java" in project.get("languages", {}):
                 try:
-                    from .java_oop_analyzer import analyze_java_project
-
-                    java_analysis = analyze_java_project(zip_path, project_path)
-                    report["projects"][i]["java_oop_analysis"] = java_analysis["java_oop_analysis"]
+                    if analyze_java_project is None:
+                        raise ImportError("java_oop_analyzer could not be imported")
+
+                    # As for Python, reuse the Java file list generate_report already classified
+                    java_files = extractor.project_java_files.get(project_path)
+                    if java_files is not None:
+                        java_oop_analysis = _analyze_java_files(extractor.zip_file, java_files).to_dict()
+                    else:
+                        java_oop_analysis = analyze_java_project(zip_path, project_path)["java_oop_analysis"]
+                    report["projects"][i]["java_oop_analysis"] = java_oop_analysis
                 except ImportError:
                     report["projects"][i]["java_oop_analysis"] = {
                         "error": "Java analyzer not available (javalang not installed)",
@@ -552,14 +1149,29 @@ def generate_comprehensive_report(
                     }
     # Save to file if requested
     if output_path:
-        import json
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        _write_report(report, output_path)
 
     return report
 
 
+def _write_report(report: Dict, output_path: Path) -> None:
+    """Save a report as indented UTF-8 JSON, encoded natively by orjson when it is installed."""
+    if orjson is not None:
+        try:
+            data = orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Values orjson cannot encode fall through to the standard library
+            pass
+        else:
+            with open(output_path, "wb") as f:
+                f.write(data)
+            return
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        # json.dump would issue a write per token; encode once and write the whole text
+        f.write(json.dumps(report, indent=2, ensure_ascii=False))
+
+
 if __name__ == "__main__":
     import sys
 
@@ -9,10 +9,12 @@ This module analyzes text documents (essays, research papers) to extract:
 
 from __future__ import annotations
 
+import math
 import re
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Pattern, Tuple
 
 try:
     import textstat
@@ -26,6 +28,22 @@ except ImportError:
     nltk = None
     sent_tokenize = None
 
+# Splitters for the sentence fallback and for paragraphs (blank-line separated)
+_SENTENCE_SPLIT = re.compile(r"[.!?]+\s+")
+_PARAGRAPH_SPLIT = re.compile(r"\n\s*\n")
+
+
+def _matches_at_least(pattern: Pattern[str], text: str, threshold: float) -> bool:
+    """Check whether a pattern matches the text at least threshold times.
+
+    The scan stops at the match that reaches the threshold instead of
+    collecting every match in the text.
+    """
+    needed = math.ceil(threshold)
+    if needed <= 0:
+        return True
+    return next(islice(pattern.finditer(text), needed - 1, None), None) is not None
+
 
 @dataclass
 class CitationAnalysis:
@@ -80,39 +98,39 @@ class DocumentAnalysis:
 class CitationDetector:
     """Detects citation styles and counts citations in academic text."""
 
-    # Citation style patterns
+    # Citation style patterns, compiled once at import
     APA_IN_TEXT = [
-        r"\([A-Z][a-zA-Z]+,?\s+(?:et al\.,?\s+)?\d{4}[a-z]?\)",  # (Author, 2020) or (Author et al., 2020)
-        r"[A-Z][a-zA-Z]+\s+(?:et al\.\s+)?\(\d{4}[a-z]?\)",  # Author (2020)
+        re.compile(r"\([A-Z][a-zA-Z]+,?\s+(?:et al\.,?\s+)?\d{4}[a-z]?\)"),  # (Author, 2020) or (Author et al., 2020)
+        re.compile(r"[A-Z][a-zA-Z]+\s+(?:et al\.\s+)?\(\d{4}[a-z]?\)"),  # Author (2020)
     ]
 
     MLA_IN_TEXT = [
-        r"\([A-Z][a-zA-Z]+(?:\s+and\s+[A-Z][a-zA-Z]+)?\s+\d+[-–]?\d*\)",  # (Author 123) or (Author 123-125)
-        r"\([A-Z][a-zA-Z]+(?:\s+and\s+[A-Z][a-zA-Z]+)?\)",  # (Author and Author)
+        re.compile(r"\([A-Z][a-zA-Z]+(?:\s+and\s+[A-Z][a-zA-Z]+)?\s+\d+[-–]?\d*\)"),  # (Author 123) or (Author 123-125)
+        re.compile(r"\([A-Z][a-zA-Z]+(?:\s+and\s+[A-Z][a-zA-Z]+)?\)"),  # (Author and Author)
     ]
 
     CHICAGO_IN_TEXT = [
-        r"\[\d+\]",  # [1] footnote style
-        r"\([A-Z][a-zA-Z]+\s+\d{4},\s*\d+\)",  # (Author 2020, 45)
+        re.compile(r"\[\d+\]"),  # [1] footnote style
+        re.compile(r"\([A-Z][a-zA-Z]+\s+\d{4},\s*\d+\)"),  # (Author 2020, 45)
     ]
 
     IEEE_IN_TEXT = [
-        r"\[\d+\]",  # [1]
-        r"\[\d+[-–]\d+\]",  # [1-3]
-        r"\[\d+,\s*\d+(?:,\s*\d+)*\]",  # [1, 2, 3]
+        re.compile(r"\[\d+\]"),  # [1]
+        re.compile(r"\[\d+[-–]\d+\]"),  # [1-3]
+        re.compile(r"\[\d+,\s*\d+(?:,\s*\d+)*\]"),  # [1, 2, 3]
     ]
 
     HARVARD_IN_TEXT = [
-        r"\([A-Z][a-zA-Z]+\s+\d{4}\)",  # (Author 2020)
-        r"\([A-Z][a-zA-Z]+\s+\d{4}:\s*\d+\)",  # (Author 2020: 45)
+        re.compile(r"\([A-Z][a-zA-Z]+\s+\d{4}\)"),  # (Author 2020)
+        re.compile(r"\([A-Z][a-zA-Z]+\s+\d{4}:\s*\d+\)"),  # (Author 2020: 45)
     ]
 
     BIBLIOGRAPHY_PATTERNS = {
-        "APA": r"^[A-Z][a-zA-Z]+,\s+[A-Z]\.\s*(?:[A-Z]\.\s*)?\(\d{4}\)",  # Author, A. (2020)
-        "MLA": r"^[A-Z][a-zA-Z]+,\s+[A-Z][a-zA-Z]+\.",  # Author, Firstname.
-        "Chicago": r"^\d+\.\s+[A-Z][a-zA-Z]+",  # 1. Author
-        "IEEE": r"^\[\d+\]\s+[A-Z]",  # [1] Author
-        "Harvard": r"^[A-Z][a-zA-Z]+,\s+[A-Z]\.\s+\(\d{4}\)",  # Author, A. (2020)
+        "APA": re.compile(r"^[A-Z][a-zA-Z]+,\s+[A-Z]\.\s*(?:[A-Z]\.\s*)?\(\d{4}\)"),  # Author, A. (2020)
+        "MLA": re.compile(r"^[A-Z][a-zA-Z]+,\s+[A-Z][a-zA-Z]+\."),  # Author, Firstname.
+        "Chicago": re.compile(r"^\d+\.\s+[A-Z][a-zA-Z]+"),  # 1. Author
+        "IEEE": re.compile(r"^\[\d+\]\s+[A-Z]"),  # [1] Author
+        "Harvard": re.compile(r"^[A-Z][a-zA-Z]+,\s+[A-Z]\.\s+\(\d{4}\)"),  # Author, A. (2020)
     }
 
     def __init__(self, text: str):
@@ -122,7 +140,8 @@ class CitationDetector:
             text: Full text of the document
         """
         self.text = text
-        self.lines = text.split("\n")
+        # Chicago and IEEE share the [1] pattern; scan the text for it once
+        self._match_counts: Dict[Pattern[str], int] = {}
 
     def detect_citation_style(self) -> CitationAnalysis:
         """Detect the primary citation style used in the document.
@@ -166,19 +185,21 @@ class CitationDetector:
 
         return analysis
 
-    def _count_citations(self, patterns: List[str]) -> int:
+    def _count_citations(self, patterns: List[Pattern[str]]) -> int:
         """Count citations matching the given patterns.
 
         Args:
-            patterns: List of regex patterns to match
+            patterns: List of compiled regex patterns to match
 
         Returns:
             Total count of matches
         """
         count = 0
         for pattern in patterns:
-            matches = re.findall(pattern, self.text)
-            count += len(matches)
+            matches = self._match_counts.get(pattern)
+            if matches is None:
+                matches = self._match_counts[pattern] = len(pattern.findall(self.text))
+            count += matches
         return count
 
     def _count_bibliography_entries(self, style: str) -> int:
@@ -196,10 +217,12 @@ class CitationDetector:
         pattern = self.BIBLIOGRAPHY_PATTERNS[style]
         count = 0
 
-        # Check last 30% of document (where references usually are)
-        start_idx = int(len(self.lines) * 0.7)
-        for line in self.lines[start_idx:]:
-            if re.match(pattern, line.strip()):
+        # Check last 30% of document (where references usually are), splitting off only those lines
+        line_count = self.text.count("\n") + 1
+        start_idx = int(line_count * 0.7)
+        tail = self.text.rsplit("\n", line_count - start_idx)[1:] if start_idx else self.text.split("\n")
+        for line in tail:
+            if pattern.match(line.strip()):
                 count += 1
 
         return count
@@ -208,35 +231,50 @@ class CitationDetector:
 class WritingMetricsCalculator:
     """Calculates writing quality and complexity metrics."""
 
-    FORMAL_INDICATORS = [
-        r"\bhowever\b",
-        r"\bmoreover\b",
-        r"\bfurthermore\b",
-        r"\bnevertheless\b",
-        r"\bconsequently\b",
-        r"\btherefore\b",
-        r"\bthus\b",
-        r"\bhence\b",
-        r"\bsubsequently\b",
-        r"\baccordingly\b",
-        r"\bindeed\b",
-        r"\bspecifically\b",
-    ]
-
-    TECHNICAL_INDICATORS = [
-        r"\banalysis\b",
-        r"\bmethodology\b",
-        r"\bhypothesis\b",
-        r"\bframework\b",
-        r"\bparadigm\b",
-        r"\bempirical\b",
-        r"\btheoretical\b",
-        r"\bsignificant\b",
-        r"\bcorrelation\b",
-        r"\bvariable\b",
-        r"\bdata\b",
-        r"\bresearch\b",
-    ]
+    # One alternation of whole words, so the text is scanned once
+    FORMAL_INDICATORS = re.compile(
+        r"\b(?:"
+        + "|".join(
+            (
+                "however",
+                "moreover",
+                "furthermore",
+                "nevertheless",
+                "consequently",
+                "therefore",
+                "thus",
+                "hence",
+                "subsequently",
+                "accordingly",
+                "indeed",
+                "specifically",
+            )
+        )
+        + r")\b",
+        re.IGNORECASE,
+    )
+
+    TECHNICAL_INDICATORS = re.compile(
+        r"\b(?:"
+        + "|".join(
+            (
+                "analysis",
+                "methodology",
+                "hypothesis",
+                "framework",
+                "paradigm",
+                "empirical",
+                "theoretical",
+                "significant",
+                "correlation",
+                "variable",
+                "data",
+                "research",
+            )
+        )
+        + r")\b",
+        re.IGNORECASE,
+    )
 
     def __init__(self, text: str):
         """Initialize metrics calculator with document text.
@@ -254,9 +292,8 @@ class WritingMetricsCalculator:
         """
         metrics = WritingMetrics()
 
-        # Word count
-        words = self.text.split()
-        metrics.word_count = len(words)
+        # Word count, reused by the tone checks below
+        metrics.word_count = len(self.text.split())
         metrics.page_estimate = round(metrics.word_count / 250, 1)
 
         # Sentence analysis
@@ -287,8 +324,8 @@ class WritingMetricsCalculator:
                 pass
 
         # Tone analysis
-        metrics.has_formal_tone = self._check_formal_tone()
-        metrics.has_technical_vocabulary = self._check_technical_vocabulary()
+        metrics.has_formal_tone = self._check_formal_tone(metrics.word_count)
+        metrics.has_technical_vocabulary = self._check_technical_vocabulary(metrics.word_count)
 
         return metrics
 
@@ -305,63 +342,63 @@ class WritingMetricsCalculator:
                 pass
 
         # Fallback: split on common sentence endings
-        sentences = re.split(r"[.!?]+\s+", self.text)
+        sentences = _SENTENCE_SPLIT.split(self.text)
         return [s.strip() for s in sentences if s.strip()]
 
-    def _check_formal_tone(self) -> bool:
+    def _check_formal_tone(self, word_count: int) -> bool:
         """Check if the text uses formal academic language.
 
+        Args:
+            word_count: Number of words in the text
+
         Returns:
             True if formal tone detected
         """
-        formal_count = 0
-        for pattern in self.FORMAL_INDICATORS:
-            matches = re.findall(pattern, self.text, re.IGNORECASE)
-            formal_count += len(matches)
-
         # Consider formal if at least 3 formal indicators per 1000 words
-        words_count = len(self.text.split())
-        return formal_count >= (words_count / 1000) * 3
+        return _matches_at_least(self.FORMAL_INDICATORS, self.text, (word_count / 1000) * 3)
 
-    def _check_technical_vocabulary(self) -> bool:
+    def _check_technical_vocabulary(self, word_count: int) -> bool:
         """Check if the text uses technical/academic vocabulary.
 
+        Args:
+            word_count: Number of words in the text
+
         Returns:
             True if technical vocabulary detected
         """
-        technical_count = 0
-        for pattern in self.TECHNICAL_INDICATORS:
-            matches = re.findall(pattern, self.text, re.IGNORECASE)
-            technical_count += len(matches)
-
         # Consider technical if at least 5 technical terms per 1000 words
-        words_count = len(self.text.split())
-        return technical_count >= (words_count / 1000) * 5
+        return _matches_at_least(self.TECHNICAL_INDICATORS, self.text, (word_count / 1000) * 5)
 
 
 class StructureAnalyzer:
     """Analyzes document structure and organization."""
 
     INTRO_KEYWORDS = [
-        r"\bintroduction\b",
-        r"\bthis\s+paper\b",
-        r"\bthis\s+essay\b",
-        r"\bthis\s+study\b",
-        r"\bthis\s+research\b",
-        r"\bbegin\s+by\b",
-        r"\bfirstly\b",
-        r"\bin\s+this\s+paper\b",
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            r"\bintroduction\b",
+            r"\bthis\s+paper\b",
+            r"\bthis\s+essay\b",
+            r"\bthis\s+study\b",
+            r"\bthis\s+research\b",
+            r"\bbegin\s+by\b",
+            r"\bfirstly\b",
+            r"\bin\s+this\s+paper\b",
+        )
     ]
 
     CONCLUSION_KEYWORDS = [
-        r"\bconclusion\b",
-        r"\bin\s+conclusion\b",
-        r"\bto\s+conclude\b",
-        r"\bin\s+summary\b",
-        r"\bto\s+summarize\b",
-        r"\bfinally\b",
-        r"\bin\s+closing\b",
-        r"\bultimately\b",
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            r"\bconclusion\b",
+            r"\bin\s+conclusion\b",
+            r"\bto\s+conclude\b",
+            r"\bin\s+summary\b",
+            r"\bto\s+summarize\b",
+            r"\bfinally\b",
+            r"\bin\s+closing\b",
+            r"\bultimately\b",
+        )
     ]
 
     def __init__(self, text: str):
@@ -409,18 +446,18 @@ class StructureAnalyzer:
             List of paragraph strings
         """
         # Split on double newlines (common paragraph separator)
-        paragraphs = re.split(r"\n\s*\n", self.text)
+        paragraphs = _PARAGRAPH_SPLIT.split(self.text)
 
         # Filter out very short paragraphs (likely not real paragraphs)
         paragraphs = [p.strip() for p in paragraphs if len(p.strip().split()) >= 20]
 
         return paragraphs
 
-    def _has_section(self, keywords: List[str], first_third: bool = False, last_third: bool = False) -> bool:
+    def _has_section(self, keywords: List[Pattern[str]], first_third: bool = False, last_third: bool = False) -> bool:
         """Check if a section (intro/conclusion) exists based on keywords.
 
         Args:
-            keywords: List of regex patterns to search for
+            keywords: List of compiled regex patterns to search for
             first_third: Only search in first third of document
             last_third: Only search in last third of document
 
@@ -437,7 +474,7 @@ class StructureAnalyzer:
             text_to_search = text_to_search[cutoff:]
 
         for pattern in keywords:
-            if re.search(pattern, text_to_search, re.IGNORECASE):
+            if pattern.search(text_to_search):
                 return True
 
         return False
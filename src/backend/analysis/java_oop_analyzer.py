@@ -14,7 +14,8 @@ Analysis Phases:
 import re
 import zipfile
 from collections import Counter, defaultdict
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -72,7 +73,40 @@ class JavaOOPAnalysis:
     getter_setter_pairs: int = 0
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # Read through a precomputed field list rather than asdict(), which deep-copies every field
+        # reflectively; the containers only hold strings and ints, so copying them one level deep is enough
+        data = {name: getattr(self, name) for name in _FIELD_NAMES}
+        data["abstract_classes"] = list(self.abstract_classes)
+        data["annotations"] = dict(self.annotations)
+        data["design_patterns"] = list(self.design_patterns)
+        return data
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(JavaOOPAnalysis))
+
+
+# JavaOOPAnalysis counters that add up across files; inheritance depth is combined with max instead
+_SUMMED_FIELDS = (
+    "total_classes",
+    "interface_count",
+    "enum_count",
+    "private_methods",
+    "protected_methods",
+    "public_methods",
+    "package_methods",
+    "private_fields",
+    "protected_fields",
+    "public_fields",
+    "classes_with_inheritance",
+    "override_count",
+    "method_overloads",
+    "generic_classes",
+    "nested_classes",
+    "anonymous_classes",
+    "lambda_count",
+    "getter_setter_pairs",
+)
+_summed_counters = attrgetter(*_SUMMED_FIELDS)
 
 
 @dataclass
@@ -419,6 +453,37 @@ def analyze_java_file(content: str) -> JavaOOPAnalysis:
     return analyzer.analyze_file(content)
 
 
+def _analyze_java_files(zf: zipfile.ZipFile, java_files: List[Dict]) -> JavaOOPAnalysis:
+    """Analyze already-classified Java files from an open archive into one combined analysis."""
+    file_analyses = []
+    for file_info in java_files:
+        try:
+            content = zf.read(file_info["path"]).decode("utf-8", errors="ignore")
+            file_analyses.append(analyze_java_file(content))
+        except Exception as e:
+            print(f"Warning: Failed to analyze {file_info['path']}: {e}")
+            continue
+
+    combined_analysis = JavaOOPAnalysis()
+    if not file_analyses:
+        return combined_analysis
+
+    # Counters are summed a column at a time, and annotation tallies merged with one Counter update per file
+    for name, column in zip(_SUMMED_FIELDS, zip(*map(_summed_counters, file_analyses))):
+        setattr(combined_analysis, name, sum(column))
+    combined_analysis.inheritance_depth = max(file_analysis.inheritance_depth for file_analysis in file_analyses)
+    annotations: Counter = Counter()
+    for file_analysis in file_analyses:
+        combined_analysis.abstract_classes.extend(file_analysis.abstract_classes)
+        annotations.update(file_analysis.annotations)
+    combined_analysis.annotations = dict(annotations)
+    # Patterns keep the order in which they were first seen
+    combined_analysis.design_patterns = list(
+        dict.fromkeys(pattern for file_analysis in file_analyses for pattern in file_analysis.design_patterns)
+    )
+    return combined_analysis
+
+
 def analyze_java_project(zip_path: Path, project_path: str = "") -> Dict:
     """
     Perform deep OOP analysis on a Java project in a ZIP file.
@@ -426,60 +491,11 @@ def analyze_java_project(zip_path: Path, project_path: str = "") -> Dict:
     if MetadataExtractor is None or FileClassifier is None:
         raise ImportError("MetadataExtractor and FileClassifier are required for project analysis")
 
+    # One archive handle serves the metadata pass and the file reads, and the metadata
+    # pass's classification supplies the Java file list
     with MetadataExtractor(zip_path) as extractor:
         metadata = extractor.extract_project_metadata(project_path)
-    combined_analysis = JavaOOPAnalysis()
-
-    with zipfile.ZipFile(zip_path, "r") as zf:
-        # Get list of Java files from metadata
-        java_files = []
-        classifier = FileClassifier(zip_path)
-        classification = classifier.classify_project(project_path)
-
-        if "java" in classification["files"]["code"]:
-            java_files = classification["files"]["code"]["java"]
-
-        for file_info in java_files:
-            try:
-                content = zf.read(file_info["path"]).decode("utf-8", errors="ignore")
-                file_analysis = analyze_java_file(content)
-
-                combined_analysis.total_classes += file_analysis.total_classes
-                combined_analysis.interface_count += file_analysis.interface_count
-                combined_analysis.abstract_classes.extend(file_analysis.abstract_classes)
-                combined_analysis.enum_count += file_analysis.enum_count
-
-                combined_analysis.private_methods += file_analysis.private_methods
-                combined_analysis.protected_methods += file_analysis.protected_methods
-                combined_analysis.public_methods += file_analysis.public_methods
-                combined_analysis.package_methods += file_analysis.package_methods
-
-                combined_analysis.private_fields += file_analysis.private_fields
-                combined_analysis.protected_fields += file_analysis.protected_fields
-                combined_analysis.public_fields += file_analysis.public_fields
-
-                combined_analysis.classes_with_inheritance += file_analysis.classes_with_inheritance
-                combined_analysis.inheritance_depth = max(combined_analysis.inheritance_depth, file_analysis.inheritance_depth)
-                combined_analysis.override_count += file_analysis.override_count
-                combined_analysis.method_overloads += file_analysis.method_overloads
-
-                combined_analysis.generic_classes += file_analysis.generic_classes
-                combined_analysis.nested_classes += file_analysis.nested_classes
-                combined_analysis.anonymous_classes += file_analysis.anonymous_classes
-                combined_analysis.lambda_count += file_analysis.lambda_count
-
-                combined_analysis.getter_setter_pairs += file_analysis.getter_setter_pairs
-                for anno, count in file_analysis.annotations.items():
-                    combined_analysis.annotations[anno] = combined_analysis.annotations.get(anno, 0) + count
-                for pattern in file_analysis.design_patterns:
-                    if pattern not in combined_analysis.design_patterns:
-                        combined_analysis.design_patterns.append(pattern)
-
-            except Exception as e:
-                print(f"Warning: Failed to analyze {file_info['path']}: {e}")
-                continue
-
-        classifier.close()
+        combined_analysis = _analyze_java_files(extractor.zip_file, extractor.project_java_files.get(project_path, []))
 
     result = {
         "project_name": metadata.project_name,
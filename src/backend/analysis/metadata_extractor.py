@@ -180,8 +180,11 @@ class MetadataExtractor:
 
         self.zip_path = zip_path
         self.zip_file = zipfile.ZipFile(zip_path, "r")
-        self.classifier = FileClassifier(zip_path)
+        self.classifier = FileClassifier(zip_path, zip_file=self.zip_file)
         self.target_user_email = target_user_email
+        # project path -> classified Python/Java files, kept so later phases need not classify the project again
+        self.project_python_files: Dict[str, List[Dict[str, Any]]] = {}
+        self.project_java_files: Dict[str, List[Dict[str, Any]]] = {}
 
     def _is_excluded_directory(self, path: str) -> bool:
         """
@@ -730,6 +733,8 @@ class MetadataExtractor:
             total_size=stats["total_size"],
         )
         metadata.target_user_email = self.target_user_email
+        self.project_python_files[project_path] = files["code"].get("python", [])
+        self.project_java_files[project_path] = files["code"].get("java", [])
 
         # Count files by category
         metadata.code_files = sum(len(files_list) for files_list in files["code"].values())
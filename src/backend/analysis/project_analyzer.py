@@ -12,7 +12,7 @@ This module classifies files within a project (inside a ZIP archive) into catego
 import zipfile
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 
 
 class FileClassifier:
@@ -99,15 +99,18 @@ class FileClassifier:
 
     # the below 4 functions are basic and self explanatory.
 
-    def __init__(self, zip_path: Path):
+    def __init__(self, zip_path: Path, zip_file: Optional[zipfile.ZipFile] = None):
         """
         Initialize the classifier with a ZIP file.
 
         Args:
             zip_path: Path to the ZIP file containing projects
+            zip_file: Already-open handle on zip_path to share instead of re-reading
+                the archive's central directory; it is left open by close()
         """
         self.zip_path = zip_path
-        self.zip_file = zipfile.ZipFile(zip_path, "r")
+        self._owns_zip = zip_file is None
+        self.zip_file = zipfile.ZipFile(zip_path, "r") if zip_file is None else zip_file
 
     def should_ignore_path(self, file_path: str) -> bool:
         """
@@ -336,13 +339,15 @@ class FileClassifier:
 
         return result
 
-    def analyze_python_complexity(self, project_root_path: str) -> Dict[str, any]:
+    def analyze_python_complexity(self, project_root_path: str, collect_details: bool = True) -> Dict[str, any]:
         """
         Analyze Python files for time complexity patterns.
 
         Args:
             project_root_path: Root path of the project within the ZIP
                             (e.g., 'my-project/' or 'folder/my-project/')
+            collect_details: If False, only summary counts and the score are
+                            computed (the report carries no per-line insights)
 
         Returns:
             Dictionary with complexity analysis report
@@ -394,13 +399,14 @@ class FileClassifier:
                 "message": "No Python files found in project",
             }
 
-        report = analyze_python_project(python_files)
+        report = analyze_python_project(python_files, collect_details=collect_details)
 
         return {
             "total_files": report.total_files_analyzed,
             "score": report.optimization_score,
             "summary": report.summary,
-            "insights_count": len(report.insights),
+            # Taken from the summary so it is also filled when per-line insights are not collected
+            "insights_count": sum(report.summary.values()),
             "report": report,  # Full report object for detailed display
         }
 
@@ -408,7 +414,7 @@ class FileClassifier:
 
     def close(self):
         """Close the ZIP file."""
-        if hasattr(self, "zip_file"):
+        if hasattr(self, "zip_file") and self._owns_zip:
             self.zip_file.close()
 
     def __enter__(self):
@@ -1008,7 +1008,8 @@ def analyze_complexity(zip_path: Path, verbose: bool = False) -> int:
                 else:
                     print("\n Analyzing Python code in ZIP root")
 
-                result = classifier.analyze_python_complexity(project_path)
+                # Per-line insights are only displayed in verbose mode
+                result = classifier.analyze_python_complexity(project_path, collect_details=verbose)
 
                 if result["total_files"] == 0:
                     print(f"   No Python files found")
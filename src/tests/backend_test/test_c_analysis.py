@@ -13,6 +13,7 @@ Run tests:
 from __future__ import annotations
 
 import sys
+import zipfile
 from pathlib import Path
 
 import pytest
@@ -282,6 +283,36 @@ class TestCompleteProjects:
         oop_score = calculate_oop_score(COOPAnalysis(**analysis))
         assert oop_score >= 5
 
+    def test_include_from_sibling_directory(self, tmp_path):
+        """Test that a source file can include a header from a sibling directory."""
+        zip_path = tmp_path / "layout.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr(
+                "proj/inc/shape.h",
+                "#include <stdlib.h>\n"
+                "typedef struct Shape { double width; double height; } Shape;\n"
+                "typedef double (*AreaFn)(const Shape *shape);\n",
+            )
+            zf.writestr(
+                "proj/src/shape.c",
+                '#include "../inc/shape.h"\n'
+                "Shape *shape_create(double width, double height) {\n"
+                "    Shape *shape = (Shape *)malloc(sizeof(Shape));\n"
+                "    shape->width = width;\n"
+                "    shape->height = height;\n"
+                "    return shape;\n"
+                "}\n"
+                "void shape_destroy(Shape *shape) { free(shape); }\n",
+            )
+
+        result = analyze_c_project(zip_path)
+        analysis = result["c_oop_analysis"]
+
+        assert analysis["malloc_usage"] == 1
+        assert analysis["free_usage"] == 1
+        # The header is analyzed on its own and again through the include
+        assert analysis["typedef_count"] == 4
+
 
 @pytest.mark.skipif(not CLANG_AVAILABLE, reason="libclang not installed")
 class TestScoringFunctions:
@@ -76,6 +76,18 @@ def check_membership():
         assert len(set_insights) >= 1
         assert any(i.severity == "good_practice" for i in set_insights)
 
+    def test_set_constructor_assignment_reported_once(self):
+        """Test that x = set() yields a single insight rather than one per visitor."""
+        code = """
+def collect():
+    seen = set()
+    return seen
+"""
+        insights = analyze_python_file("test.py", code)
+
+        set_insights = [i for i in insights if i.complexity_type == "set_operations"]
+        assert len(set_insights) == 1
+
     def test_dict_usage_good_practice(self):
         """Test detection of efficient dictionary usage."""
         code = """
@@ -168,6 +180,25 @@ def fibonacci(n):
         assert len(memo_insights) >= 1
         assert "caching" in memo_insights[0].description.lower()
 
+    def test_memoization_decorator_variants(self):
+        """Test detection of attribute and cached_property memoization decorators."""
+        code = """
+import functools
+
+class Repo:
+    @functools.cached_property
+    def index(self):
+        return build_index()
+
+@functools.cache
+def load(name):
+    return name
+"""
+        insights = analyze_python_file("test.py", code)
+
+        memo_insights = [i for i in insights if i.complexity_type == "memoization"]
+        assert [i.line_number for i in memo_insights] == [6, 10]
+
     def test_inefficient_membership_test(self):
         """Test detection of inefficient membership tests in loops."""
         code = """
@@ -184,6 +215,94 @@ def check_items(data_list, search_items):
         # Should suggest using set or dict
         assert len(inefficient) >= 1
 
+    def test_membership_test_in_nested_loop_reported_once(self):
+        """Test that a membership test inside nested loops is reported only once."""
+        code = """
+def check_items(rows, data_list):
+    for row in rows:
+        for item in row:
+            if item in data_list:
+                print(item)
+"""
+        insights = analyze_python_file("test.py", code)
+
+        inefficient = [i for i in insights if i.complexity_type == "inefficient_membership_test"]
+        assert len(inefficient) == 1
+        assert inefficient[0].line_number == 5
+
+    def test_membership_test_in_nested_function_not_attributed_to_loop(self):
+        """Test that functions defined inside a loop are not treated as loop bodies."""
+        code = """
+def build_checks(groups, allowed_list):
+    checks = []
+    for group in groups:
+        def check(value):
+            return value in allowed_list
+        checks.append(check)
+    return checks
+"""
+        insights = analyze_python_file("test.py", code)
+
+        assert not [i for i in insights if i.complexity_type == "inefficient_membership_test"]
+
+    def test_repeated_analysis_uses_cache(self, monkeypatch):
+        """Test that unchanged sources are served from the memoization cache."""
+        from backend.analysis import complexity_analyzer
+
+        code = """
+def unique_values(values):
+    return set(values)
+"""
+        first = analyze_python_file("cached.py", code)
+        first.clear()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("source should not be re-analyzed")
+
+        monkeypatch.setattr(complexity_analyzer, "_analyze_python_source", fail)
+        second = analyze_python_file("cached.py", code)
+
+        assert [i.complexity_type for i in second] == ["set_operations"]
+
+    def test_cache_eviction_waits_for_lookup(self, monkeypatch):
+        """Test that another thread cannot evict an entry while it is being looked up."""
+        import threading
+        from collections import OrderedDict
+
+        from backend.analysis import complexity_analyzer
+
+        evictions = []
+
+        class EvictingCache(OrderedDict):
+            def get(self, key, default=None):
+                value = super().get(key, default)
+                if not evictions:
+                    # Another thread stores a new file between the lookup and the reordering
+                    store = threading.Thread(target=complexity_analyzer._cache_put, args=(("new.py", b"", True), ((), {})))
+                    evictions.append(store)
+                    evictions[0].start()
+                    evictions[0].join(0.2)
+                return value
+
+        monkeypatch.setattr(complexity_analyzer, "_INSIGHT_CACHE", EvictingCache())
+        monkeypatch.setattr(complexity_analyzer, "_INSIGHT_CACHE_SIZE", 1)
+        complexity_analyzer._INSIGHT_CACHE[("old.py", b"", True)] = ((), {})
+
+        assert complexity_analyzer._cache_get(("old.py", b"", True)) == ((), {})
+        evictions[0].join()
+        assert list(complexity_analyzer._INSIGHT_CACHE) == [("new.py", b"", True)]
+
+    def test_deeply_nested_expression(self):
+        """Test that deeply nested expressions do not exhaust the recursion limit."""
+        code = "total = " + " + ".join(["value"] * 1500) + "\n"
+        code += "for row in rows:\n    for cell in row:\n        pass\n"
+
+        insights = analyze_python_file("deep.py", code)
+
+        nested = [i for i in insights if i.complexity_type == "nested_loops"]
+        assert len(nested) == 1
+        assert nested[0].line_number == 3
+
     def test_syntax_error_handling(self):
         """Test that syntax errors don't crash the analyzer."""
         code = """
@@ -240,6 +359,20 @@ class TestComplexityReport:
         assert len(report.insights) == 1
         assert report.summary["nested_loops"] == 1
 
+    def test_add_insights_batch(self):
+        """Test adding a batch of insights updates list and summary together."""
+        report = ComplexityReport(total_files_analyzed=1)
+        batch = [
+            ComplexityInsight("a.py", 1, "nested_loops", "suggestion", "Loop"),
+            ComplexityInsight("a.py", 2, "nested_loops", "suggestion", "Loop"),
+            ComplexityInsight("a.py", 3, "memoization", "good_practice", "Cache"),
+        ]
+
+        report.add_insights(batch)
+
+        assert report.insights == batch
+        assert report.summary == {"nested_loops": 2, "memoization": 1}
+
     def test_score_calculation_good_practices(self):
         """Test score calculation with good practices."""
         report = ComplexityReport(total_files_analyzed=1)
@@ -370,6 +503,53 @@ def efficient():
         assert len(report.insights) >= 2
         assert report.optimization_score > 0
 
+    def test_summary_only_mode_matches_detailed_counts(self):
+        """Test that collect_details=False yields the same summary and score without insights."""
+        files = [
+            (
+                "summary_only.py",
+                """
+def process(rows, lookup_list):
+    squares = [x * x for x in rows]
+    for row in rows:
+        for cell in row:
+            if cell in lookup_list:
+                pass
+    return sorted(squares, key=abs)
+""",
+            )
+        ]
+
+        detailed = analyze_python_project(files)
+        summary_only = analyze_python_project(files, collect_details=False)
+
+        assert summary_only.insights == []
+        assert summary_only.summary == detailed.summary
+        assert summary_only.optimization_score == detailed.optimization_score
+
+    def test_large_project_matches_per_file_analysis(self):
+        """Test that projects large enough for parallel analysis aggregate every file."""
+        files = [
+            (
+                f"pkg/module_{n}.py",
+                f"""
+def work_{n}(values):
+    for a in values:
+        for b in values:
+            pass
+    return [v for v in values]
+""",
+            )
+            for n in range(24)
+        ]
+
+        report = analyze_python_project(files)
+
+        assert report.total_files_analyzed == 24
+        assert report.summary["nested_loops"] == 24
+        assert report.summary["list_comprehension"] == 24
+        assert [i.file_path for i in report.insights if i.complexity_type == "nested_loops"] == [path for path, _ in files]
+
     def test_empty_project(self):
         """Test analyzing project with no files."""
         report = analyze_python_project([])
@@ -475,6 +655,9 @@ def deduplicate(items):
             assert "summary" in result
             assert result["insights_count"] >= 2
 
+            summary_only = classifier.analyze_python_complexity("project", collect_details=False)
+            assert summary_only["insights_count"] == result["insights_count"]
+
     def test_analyze_non_python_project(self, tmp_path):
         """Test complexity analysis on project with no Python files."""
         zip_path = tmp_path / "no_python.zip"
@@ -851,6 +1034,22 @@ public class Helper {
         assert any("set" in i.complexity_type.lower() for i in report.insights)
         assert any("efficient_data_structure" in i.complexity_type for i in report.insights)
 
+    def test_analyze_project_summary_only(self):
+        """Test that collect_details=False keeps the summary while skipping Python insights."""
+        from backend.analysis.complexity_analyzer import analyze_project
+
+        files = [
+            ("loops.py", "for a in b:\n    for c in d:\n        pass\n"),
+            ("Test.java", "Set<String> x = new HashSet<>();"),
+        ]
+
+        detailed = analyze_project(files, language="auto")
+        summary_only = analyze_project(files, language="auto", collect_details=False)
+
+        assert summary_only.summary == detailed.summary
+        assert summary_only.optimization_score == detailed.optimization_score
+        assert all(i.file_path == "Test.java" for i in summary_only.insights)
+
     def test_analyze_project_python_only(self):
         """Test analyzing Python-only project with auto-detect."""
         from backend.analysis.complexity_analyzer import analyze_project
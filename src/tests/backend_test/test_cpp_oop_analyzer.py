@@ -2,8 +2,12 @@
 Tests for C++ OOP Analyzer Module
 """
 
+import zipfile
+from collections import OrderedDict
+
 import pytest
 
+from backend.analysis import cpp_oop_analyzer
 from backend.analysis.cpp_oop_analyzer import (CLANG_AVAILABLE, CppOOPAnalysis,
                                                CppOOPAnalyzer,
                                                analyze_cpp_file,
@@ -192,6 +196,116 @@ class TestCppOOPAnalyzer:
         assert analysis.public_fields >= 1
         assert analysis.public_methods >= 2
 
+    def test_class_members_counted_once(self):
+        """Test that each member is counted once, including members of nested classes."""
+        analysis = analyze_cpp_file(ENCAPSULATION_CODE)
+
+        assert analysis.private_fields == 2
+        assert analysis.private_methods == 1
+        assert analysis.protected_fields == 1
+        assert analysis.protected_methods == 1
+        assert analysis.public_fields == 1
+        assert analysis.public_methods == 2
+
+        nested_code = """
+        class Outer {
+        public:
+            struct Inner {
+                int value;
+                void reset() {}
+            };
+            void run() {}
+        };
+        """
+        analysis = analyze_cpp_file(nested_code)
+
+        assert analysis.total_classes == 1
+        assert analysis.struct_count == 1
+        assert analysis.public_fields == 1
+        assert analysis.public_methods == 2
+
+        friend_code = """
+        class Vec {
+        public:
+            Vec operator+(const Vec& other) const;
+            friend bool operator==(const Vec& a, const Vec& b);
+            friend Vec operator-(const Vec& a, const Vec& b);
+        };
+        """
+        analysis = analyze_cpp_file(friend_code)
+
+        assert analysis.operator_overloads == 3
+
+    def test_union_and_member_template_members_counted(self):
+        """Test that members of anonymous unions and member templates belong to the enclosing class."""
+        union_code = """
+        class Variant {
+            union { int i; float f; };
+            int tag;
+        public:
+            int get();
+        };
+        """
+        analysis = analyze_cpp_file(union_code)
+
+        assert analysis.public_fields == 2
+        assert analysis.private_fields == 1
+        assert analysis.public_methods == 1
+
+        template_code = """
+        class Outer {
+        public:
+            template <class T> struct In { void go(); int v; };
+            void a();
+            void b();
+        };
+        """
+        analysis = analyze_cpp_file(template_code)
+
+        assert analysis.total_classes == 1
+        assert analysis.public_methods == 3
+        assert analysis.public_fields == 1
+
+        field_struct_code = """
+        class Shape {
+            struct Point { int x; int y; } origin;
+        };
+        """
+        analysis = analyze_cpp_file(field_struct_code)
+
+        assert analysis.struct_count == 1
+        assert analysis.public_fields == 2
+        assert analysis.private_fields == 1
+
+    def test_inheritance_depth_longest_chain(self):
+        """Test that inheritance depth follows the longest chain regardless of visit order."""
+        analyzer = CppOOPAnalyzer()
+        analyzer.inheritance_tree.update({"Base": ["Leaf", "Middle"], "Middle": ["Leaf"]})
+        analyzer._compute_inheritance_depth()
+
+        assert analyzer.analysis.inheritance_depth == 2
+
+        analyzer = CppOOPAnalyzer()
+        analyzer.inheritance_tree.update({"Root": ["A"], "A": ["B"], "B": ["A"]})
+        analyzer._compute_inheritance_depth()
+
+        assert analyzer.analysis.inheritance_depth == 1
+
+    def test_repeated_analysis_uses_cache(self, monkeypatch):
+        """Test that identical sources are served from the cache as independent copies."""
+        code = SIMPLE_CLASS.replace("SimpleClass", "CachedClass")
+        first = analyze_cpp_file(code)
+        first.abstract_classes.append("Mutated")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("source should not be re-parsed")
+
+        monkeypatch.setattr(cpp_oop_analyzer, "_analyze_cpp_job", fail)
+        second = analyze_cpp_file(code)
+
+        assert second.total_classes == 1
+        assert second.abstract_classes == []
+
     def test_empty_code(self):
         """Test analyzer with empty code."""
         analysis = analyze_cpp_file("")
@@ -216,6 +330,52 @@ class TestCppOOPAnalyzer:
         assert analysis.struct_count == 0
 
 
+class TestProjectAnalysis:
+    """Test project-level analysis over a ZIP archive."""
+
+    def test_parallel_project_matches_serial(self, tmp_path, monkeypatch):
+        """Test that pooled parsing of a larger project matches the serial result."""
+        zip_path = tmp_path / "cpp_project.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            for i in range(12):
+                zf.writestr(f"cpp_project/src/shape{i}.cpp", INHERITANCE_CODE.replace("Animal", f"Animal{i}"))
+
+        parallel = cpp_oop_analyzer.analyze_cpp_project(zip_path, "cpp_project")["cpp_oop_analysis"]
+
+        monkeypatch.setattr(cpp_oop_analyzer, "_PARALLEL_MIN_FILES", 100)
+        monkeypatch.setattr(cpp_oop_analyzer, "_ANALYSIS_CACHE", OrderedDict())
+        serial = cpp_oop_analyzer.analyze_cpp_project(zip_path, "cpp_project")["cpp_oop_analysis"]
+
+        assert parallel == serial
+        assert parallel["total_classes"] == 36
+        assert len(parallel["abstract_classes"]) == 12
+
+    def test_cache_eviction_waits_for_lookup(self, monkeypatch):
+        """Test that another thread cannot evict an entry while it is being looked up."""
+        import threading
+
+        evictions = []
+
+        class EvictingCache(OrderedDict):
+            def get(self, key, default=None):
+                value = super().get(key, default)
+                if not evictions:
+                    # Another thread stores a new file between the lookup and the reordering
+                    store = threading.Thread(target=cpp_oop_analyzer._cache_put, args=(b"new", CppOOPAnalysis()))
+                    evictions.append(store)
+                    store.start()
+                    store.join(0.2)
+                return value
+
+        monkeypatch.setattr(cpp_oop_analyzer, "_ANALYSIS_CACHE", EvictingCache())
+        monkeypatch.setattr(cpp_oop_analyzer, "_ANALYSIS_CACHE_SIZE", 1)
+        cpp_oop_analyzer._ANALYSIS_CACHE[b"old"] = CppOOPAnalysis(total_classes=1)
+
+        assert cpp_oop_analyzer._cache_get(b"old").total_classes == 1
+        evictions[0].join()
+        assert list(cpp_oop_analyzer._ANALYSIS_CACHE) == [b"new"]
+
+
 class TestScoringFunctions:
     """Test the scoring functions."""
 
@@ -329,6 +489,10 @@ class TestDataClasses:
         assert isinstance(result, dict)
         assert result["total_classes"] == 5
         assert result["abstract_classes"] == ["Base"]
+        assert list(result) == list(CppOOPAnalysis.__dataclass_fields__)
+
+        result["abstract_classes"].append("Other")
+        assert analysis.abstract_classes == ["Base"]
 
 
 if __name__ == "__main__":
@@ -33,6 +33,17 @@ class TestOOPAnalysis:
         assert analysis.inheritance_depth == 0
         assert analysis.classes_with_inheritance == 0
 
+    def test_to_dict_matches_fields(self):
+        from dataclasses import asdict
+
+        analysis = OOPAnalysis(abstract_classes=["Shape"], total_classes=3, design_patterns=["Factory"], solid_score=2.5)
+        data = analysis.to_dict()
+        assert data == asdict(analysis)
+
+        # Lists are copied, so the dict can be edited without touching the analysis
+        data["abstract_classes"].append("Other")
+        assert analysis.abstract_classes == ["Shape"]
+
 
 class TestAnalyzePythonFile:
     """Test the analyze_python_file function."""
@@ -99,6 +110,30 @@ class Max8(B737Max):
         assert result.inheritance_depth == 3
 
 
+def test_inheritance_depth_diamond_lattice():
+    # Every level inherits from both classes of the previous one; without memoization
+    # the depth walk revisits each ancestor once per path (2**levels paths).
+    levels = 40
+    lines = ["class Left0: pass", "class Right0: pass"]
+    for i in range(1, levels + 1):
+        lines.append(f"class Left{i}(Left{i - 1}, Right{i - 1}): pass")
+        lines.append(f"class Right{i}(Left{i - 1}, Right{i - 1}): pass")
+
+    result = analyze_python_file("\n".join(lines))
+
+    assert result.total_classes == 2 * (levels + 1)
+    assert result.inheritance_depth == levels
+
+
+def test_inheritance_depth_beyond_recursion_limit():
+    levels = sys.getrecursionlimit() + 500
+    lines = ["class Level0: pass"] + [f"class Level{i}(Level{i - 1}): pass" for i in range(1, levels + 1)]
+
+    result = analyze_python_file("\n".join(lines))
+
+    assert result.inheritance_depth == levels
+
+
 def test_abstract_class_detection():
     code = """
 from abc import ABC, abstractmethod
@@ -139,6 +174,56 @@ class Aircraft:
     assert result.oop_score >= 1
 
 
+def test_async_methods_classified():
+    code = """
+class Hangar:
+    async def open_doors(self):
+        pass
+
+    async def _check_locks(self):
+        pass
+
+    def close_doors(self):
+        pass
+"""
+    result = analyze_python_file(code)
+
+    assert result.public_methods == 2
+    assert result.protected_methods == 1
+
+
+def test_nested_class_definitions_found():
+    code = """
+if True:
+    class Runway:
+        class Light:
+            pass
+try:
+    pass
+except ImportError:
+    class Tower:
+        pass
+else:
+    pass
+finally:
+    class Gate:
+        pass
+
+def build():
+    for _ in range(3):
+        class Hangar:
+            pass
+    while False:
+        pass
+    else:
+        class Apron:
+            pass
+"""
+    result = analyze_python_file(code)
+
+    assert result.total_classes == 6
+
+
 def test_design_pattern_detection():
     code = """
 class PlaneFactory: pass
@@ -154,6 +239,418 @@ class StrategyPlane: pass
     assert "Strategy" in patterns
 
 
+def test_design_pattern_detection_multiple_hints_in_one_name():
+    result = analyze_python_file("class SingletonPlaneFactory: pass\nclass fleetBUILDER: pass\n")
+    assert result.design_patterns == ["Builder", "Factory", "Singleton"]
+
+
+def test_repeated_content_reuses_analysis(monkeypatch):
+    from src.backend.analysis import deep_code_analyzer
+
+    code = """
+class CachedPlaneFactory:
+    def _taxi(self):
+        pass
+"""
+    first = analyze_python_file(code)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("source should not be re-analyzed")
+
+    monkeypatch.setattr("builtins.compile", fail)
+    monkeypatch.setattr(deep_code_analyzer, "PythonOOPAnalyzer", fail)
+    second = analyze_python_file(code)
+    monkeypatch.undo()
+
+    assert second == first
+    assert second.protected_methods == 1
+
+    # Results are copies; mutating one must not leak into later lookups
+    second.design_patterns.append("Mutated")
+    assert analyze_python_file(code).design_patterns == ["Factory"]
+
+
+def test_duplicate_files_parsed_once_but_counted_each(tmp_path, monkeypatch):
+    from collections import OrderedDict
+
+    from src.backend.analysis import deep_code_analyzer
+
+    zip_path = tmp_path / "twins.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        for name in ("left", "right"):
+            zf.writestr(f"twins/{name}/engine.py", "class Engine(ABC):\n    def _spin(self):\n        pass\n")
+
+    monkeypatch.setattr(deep_code_analyzer, "_ANALYSIS_CACHE", OrderedDict())
+    parses = []
+    analyze_source = deep_code_analyzer._analyze_source
+    monkeypatch.setattr(deep_code_analyzer, "_analyze_source", lambda content: parses.append(content) or analyze_source(content))
+    result = deep_code_analyzer.analyze_project_deep(zip_path, "twins")["oop_analysis"]
+
+    assert len(parses) == 1
+    assert result["total_classes"] == 2
+    assert result["abstract_classes"] == ["Engine", "Engine"]
+    # The reduction reads cached results in place and must leave them as they were
+    (cached,) = deep_code_analyzer._ANALYSIS_CACHE.values()
+    assert cached.abstract_classes == ["Engine"]
+    assert cached.total_classes == 1
+
+
+def test_cache_eviction_waits_for_lookup(monkeypatch):
+    import threading
+    from collections import OrderedDict
+
+    from src.backend.analysis import deep_code_analyzer
+
+    old_code = "class Hangar:\n    pass\n"
+    new_code = "class Runway:\n    pass\n"
+    evictions = []
+
+    class EvictingCache(OrderedDict):
+        def get(self, key, default=None):
+            value = super().get(key, default)
+            if not evictions:
+                # Another thread analyzes a new file between the lookup and the reordering
+                store = threading.Thread(target=deep_code_analyzer._cached_analysis, args=(new_code,))
+                evictions.append(store)
+                store.start()
+                store.join(0.2)
+            return value
+
+    monkeypatch.delenv("DEEP_CODE_CACHE_PATH", raising=False)
+    monkeypatch.setattr(deep_code_analyzer, "_ANALYSIS_CACHE", EvictingCache())
+    monkeypatch.setattr(deep_code_analyzer, "_ANALYSIS_CACHE_SIZE", 1)
+    deep_code_analyzer._ANALYSIS_CACHE[deep_code_analyzer._cache_key(old_code)] = OOPAnalysis(total_classes=1)
+
+    assert deep_code_analyzer._cached_analysis(old_code).total_classes == 1
+    evictions[0].join()
+    assert list(deep_code_analyzer._ANALYSIS_CACHE) == [deep_code_analyzer._cache_key(new_code)]
+
+
+def test_persistent_cache_survives_restart(tmp_path, monkeypatch):
+    import threading
+    from collections import OrderedDict
+
+    from src.backend.analysis import deep_code_analyzer
+
+    monkeypatch.setenv("DEEP_CODE_CACHE_PATH", str(tmp_path / "cache" / "oop.sqlite"))
+    monkeypatch.setattr(deep_code_analyzer, "_persistent_cache", threading.local())
+    monkeypatch.setattr(deep_code_analyzer, "_ANALYSIS_CACHE", OrderedDict())
+    code = "class HangarBuilder(ABC):\n    @property\n    def bays(self):\n        return 4\n"
+    first = analyze_python_file(code)
+
+    # A fresh in-memory cache, as in a new process, must still be served from disk
+    monkeypatch.setattr(deep_code_analyzer, "_ANALYSIS_CACHE", OrderedDict())
+    monkeypatch.setattr("builtins.compile", lambda *args, **kwargs: pytest.fail("source should not be re-parsed"))
+    second = analyze_python_file(code)
+    deep_code_analyzer._persistent_cache.entry[2].close()
+    monkeypatch.undo()
+
+    assert second == first
+    assert second.abstract_classes == ["HangarBuilder"]
+    assert second.design_patterns == ["Builder"]
+
+
+def test_persistent_cache_used_from_several_threads(tmp_path, monkeypatch):
+    import threading
+    from collections import OrderedDict
+
+    from src.backend.analysis import deep_code_analyzer
+
+    monkeypatch.setenv("DEEP_CODE_CACHE_PATH", str(tmp_path / "oop.sqlite"))
+    monkeypatch.setattr(deep_code_analyzer, "_persistent_cache", threading.local())
+    monkeypatch.setattr(deep_code_analyzer, "_ANALYSIS_CACHE", OrderedDict())
+    code = "class TowerFactory(ABC):\n    pass\n"
+    first = analyze_python_file(code)
+    deep_code_analyzer._persistent_cache.entry[2].close()
+
+    # Like the API's worker threads, each thread opens its own connection to the shared file
+    results = []
+
+    def analyze_in_thread():
+        try:
+            results.append(deep_code_analyzer._load_persistent(deep_code_analyzer._cache_key(code)))
+        finally:
+            deep_code_analyzer._persistent_cache.entry[2].close()
+
+    threads = [threading.Thread(target=analyze_in_thread) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [first, first]
+
+
+def test_function_bodies_stripped_without_changing_results():
+    from src.backend.analysis.deep_code_analyzer import _strip_function_bodies
+
+    code = '''
+class Runway:
+    def lights(self, colours={"edge":
+                              "white"}, marker="("):
+        return [c for c in colours]
+
+    def clone(self):
+        # Mentions of "class" that are not class statements do not keep a body
+        return self.__class__()
+
+    def _doc(self):
+        """
+def not_a_method():
+    class NotAClass: pass
+"""
+        return 1
+
+    @property
+    def length(self): return 3000
+
+def build():
+    class Taxiway(Runway):
+        def __eq__(self, other):
+            return True
+    return Taxiway
+'''
+    stripped, def_lines = _strip_function_bodies(code)
+    assert len(stripped) < len(code)
+    assert "return [c for c in colours]" not in stripped
+    assert "__class__" not in stripped
+    assert def_lines
+
+    result = analyze_python_file(code)
+    assert result.total_classes == 2
+    assert result.public_methods == 3
+    assert result.protected_methods == 2
+    assert result.properties_count == 1
+    assert result.operator_overloads == 1
+    assert result.inheritance_depth == 1
+
+
+def test_def_inside_string_does_not_hide_methods():
+    from src.backend.analysis.deep_code_analyzer import _parse_stripped
+
+    # The quotes after the comment close the string, so the fake def's "body" spans the real methods
+    code = """
+class Hangar:
+    '''Sample usage:
+def foo():  # '''
+    def open(self):
+        return 1
+
+    @property
+    def size(self):
+        '''Floor area.'''
+        return 2
+"""
+    assert _parse_stripped(code) is None
+
+    result = analyze_python_file(code)
+    assert result.public_methods == 2
+    assert result.properties_count == 1
+
+
+def test_class_free_file_skips_parsing(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("class-free source should not be parsed")
+
+    monkeypatch.setattr("builtins.compile", fail)
+    script = analyze_python_file(b"import os\n\ndef main():\n    print(os.getcwd())\n")
+    # "class" appears, but never as a statement
+    helper = analyze_python_file('"""Helpers to classify a class of planes."""\nkind = plane.__class__.__name__\n')
+    monkeypatch.undo()
+
+    assert script == OOPAnalysis()
+    assert helper == OOPAnalysis()
+    # A class on the very first line is still found after a byte order mark
+    assert analyze_python_file(b"\xef\xbb\xbfclass Glider:\n    pass\n").total_classes == 1
+
+
+def test_bytes_content_matches_text():
+    code = "class Engine:\n    def _spin(self):\n        pass\n    # caf\u00e9\n"
+    assert analyze_python_file(code.encode("utf-8")) == analyze_python_file(code)
+
+    # Invalid UTF-8 is dropped rather than failing the whole file
+    broken = b"class Wing:\n    def __lift(self):\n        pass\n# \xff\n"
+    assert analyze_python_file(broken).private_methods == 1
+
+
+def test_large_project_parallel_matches_serial(tmp_path, monkeypatch):
+    from src.backend.analysis import deep_code_analyzer
+
+    zip_path = tmp_path / "fleet.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        for i in range(20):
+            zf.writestr(
+                f"fleet/planes/plane{i}.py",
+                f"class Plane{i}:\n    def _taxi(self):\n        pass\n\nclass Jet{i}(Plane{i}):\n    def __add__(self, other):\n        pass\n",
+            )
+        zf.writestr("fleet/planes/broken.py", "class Broken(:\n")
+        for i in range(0, 20, 5):
+            zf.writestr(f"fleet/hangar/base{i}.py", f"class Base{i}Factory(ABC):\n    pass\n")
+
+    parallel = deep_code_analyzer.analyze_project_deep(zip_path, "fleet")["oop_analysis"]
+
+    # A caller-owned pool is used and left running for the next project
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        shared = deep_code_analyzer.analyze_project_deep(zip_path, "fleet", executor)["oop_analysis"]
+        assert executor.submit(abs, -1).result() == 1
+
+    monkeypatch.setattr(deep_code_analyzer, "_PARALLEL_MIN_FILES", 1000)
+    serial = deep_code_analyzer.analyze_project_deep(zip_path, "fleet")["oop_analysis"]
+
+    assert parallel == serial == shared
+    assert parallel["total_classes"] == 44
+    assert parallel["classes_with_inheritance"] == 24
+    assert parallel["operator_overloads"] == 20
+    assert sorted(parallel["abstract_classes"]) == ["Base0Factory", "Base10Factory", "Base15Factory", "Base5Factory"]
+    assert parallel["design_patterns"] == ["Factory"]
+
+
+def test_process_pool_is_capped_and_spawned(monkeypatch):
+    from src.backend.analysis import deep_code_analyzer
+
+    monkeypatch.setattr(deep_code_analyzer.os, "cpu_count", lambda: 64)
+    with deep_code_analyzer._optional_process_pool() as executor:
+        # Each report's pool stays small however many cores there are, and never forks the caller
+        assert executor._max_workers == deep_code_analyzer._POOL_MAX_WORKERS
+        assert executor._mp_context.get_start_method() == "spawn"
+
+    small = deep_code_analyzer._new_process_pool(0)
+    assert small._max_workers == 1
+    small.shutdown()
+
+
+def test_repeated_sources_across_projects_analyzed_once(tmp_path, monkeypatch):
+    from collections import OrderedDict
+    from concurrent.futures import ThreadPoolExecutor
+
+    from src.backend.analysis import deep_code_analyzer
+
+    zip_path = tmp_path / "vendored.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        for i in range(20):
+            vendored = f"class Session{i}(ABC):\n    def _send(self):\n        pass\n"
+            zf.writestr(f"app/vendor/lib{i}.py", vendored)
+            zf.writestr(f"app/copy/lib{i}.py", vendored)
+    python_files = [{"path": f"app/{folder}/lib{i}.py"} for folder in ("vendor", "copy") for i in range(20)]
+
+    monkeypatch.setattr(deep_code_analyzer, "_ANALYSIS_CACHE", OrderedDict())
+    jobs = []
+    analyze_job = deep_code_analyzer._analyze_python_job
+    monkeypatch.setattr(deep_code_analyzer, "_analyze_python_job", lambda content: jobs.append(content) or analyze_job(content))
+
+    # Threads share the patched job, so files sent to the pool are counted too
+    seen_sources = {}
+    with zipfile.ZipFile(zip_path) as zf, ThreadPoolExecutor(max_workers=2) as executor:
+        first = deep_code_analyzer._analyze_python_files(zf, python_files, executor, seen_sources)
+        second = deep_code_analyzer._analyze_python_files(zf, python_files, executor, seen_sources)
+
+    # Copies (same size and CRC-32 in the archive) share one analysis, within a project and across projects
+    assert len(jobs) == 20
+    assert first == second
+    assert first.total_classes == 40
+    assert sorted(first.abstract_classes) == sorted([f"Session{i}" for i in range(20)] * 2)
+
+
+def test_sources_sharing_size_and_crc_analyzed_separately(tmp_path, monkeypatch):
+    from src.backend.analysis import deep_code_analyzer
+
+    zip_path = tmp_path / "collide.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        for i in range(20):
+            zf.writestr(f"app/mod{i}.py", f"class Model{i}(ABC):\n    pass\n")
+        zf.writestr("app/copy0.py", "class Model0(ABC):\n    pass\n")
+    python_files = [{"path": f"app/mod{i}.py"} for i in range(20)] + [{"path": "app/copy0.py"}]
+
+    # Every member claims the same size and CRC-32, as different sources could by chance
+    signatures = deep_code_analyzer._member_signatures
+    monkeypatch.setattr(
+        deep_code_analyzer,
+        "_member_signatures",
+        lambda zf, files: [((0, 0), path) for _, path in signatures(zf, files)],
+    )
+    monkeypatch.setattr(deep_code_analyzer, "_PARALLEL_MIN_FILES", 4)
+    seen_sources = {}
+    with zipfile.ZipFile(zip_path) as zf:
+        first = deep_code_analyzer._analyze_python_files(zf, python_files, None, seen_sources)
+        second = deep_code_analyzer._analyze_python_files(zf, python_files, None, seen_sources)
+
+    assert first == second
+    assert first.total_classes == 21
+    assert sorted(first.abstract_classes) == sorted([f"Model{i}" for i in range(20)] + ["Model0"])
+    assert len(seen_sources[(0, 0)]) == 20
+
+
+def test_empty_and_oversized_python_files_skipped(tmp_path, monkeypatch):
+    from src.backend.analysis import deep_code_analyzer
+
+    zip_path = tmp_path / "hangar.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("hangar/small.py", "class Small:\n    pass\n")
+        zf.writestr("hangar/generated.py", "class Generated:\n    pass\n" + "# padding\n" * 200)
+        zf.writestr("hangar/__init__.py", "")
+
+    monkeypatch.setattr(deep_code_analyzer, "_MAX_SOURCE_SIZE", 1024)
+    with zipfile.ZipFile(zip_path) as zf:
+        python_files = [{"path": info.filename, "size": info.file_size} for info in zf.infolist()]
+        opened = []
+        open_member = zf.open
+        monkeypatch.setattr(zf, "open", lambda name, *args: opened.append(name) or open_member(name, *args))
+        result = deep_code_analyzer._analyze_python_files(zf, python_files)
+
+    assert result.total_classes == 1
+    assert opened == ["hangar/small.py"]
+    assert deep_code_analyzer.analyze_project_deep(zip_path, "hangar")["oop_analysis"]["total_classes"] == 1
+
+
+def test_comprehensive_report_reuses_project_classification(tmp_path, monkeypatch):
+    from src.backend.analysis import deep_code_analyzer
+
+    zip_path = tmp_path / "tower.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("tower/radar.py", "class Radar(ABC):\n    def _sweep(self):\n        pass\n")
+        zf.writestr("tower/Beacon.java", "public class Beacon {\n    private void blink() {}\n}\n")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("project metadata should not be extracted twice")
+
+    from src.backend.analysis import java_oop_analyzer
+
+    monkeypatch.setattr(deep_code_analyzer, "analyze_project_deep", fail)
+    monkeypatch.setattr(java_oop_analyzer, "analyze_java_project", fail)
+    report = deep_code_analyzer.generate_comprehensive_report(zip_path)
+
+    project = report["projects"][0]
+    oop = project["oop_analysis"]
+    assert oop["total_classes"] == 1
+    assert oop["abstract_classes"] == ["Radar"]
+    assert project["java_oop_analysis"]["total_classes"] == 1
+    assert project["java_oop_analysis"]["private_methods"] == 1
+    assert project["complexity_analysis"]["total_files_analyzed"] == 2
+
+
+@pytest.mark.parametrize("native", [True, False])
+def test_saved_report_is_indented_utf8_json(tmp_path, monkeypatch, native):
+    import json
+
+    from src.backend.analysis import deep_code_analyzer
+
+    if native and deep_code_analyzer.orjson is None:
+        pytest.skip("orjson not installed")
+    if not native:
+        monkeypatch.setattr(deep_code_analyzer, "orjson", None)
+
+    report = {"projects": [{"project_name": "caf\u00e9", "languages": {"python": 2}, "by_year": {2024: 3}}]}
+    output_path = tmp_path / "report.json"
+    deep_code_analyzer._write_report(report, output_path)
+
+    text = output_path.read_text(encoding="utf-8")
+    assert "caf\u00e9" in text
+    assert text.startswith('{\n  "projects"')
+    assert json.loads(text) == {"projects": [{"project_name": "caf\u00e9", "languages": {"python": 2}, "by_year": {"2024": 3}}]}
+
+
 def test_project_size_labels():
     from src.backend.analysis.deep_code_analyzer import \
         calculate_python_oop_score
@@ -184,5 +681,27 @@ def test_solid_score_ranges():
     assert 0 <= score <= 5.0
 
 
+def test_scores_per_size_tier():
+    from src.backend.analysis.deep_code_analyzer import calculate_python_oop_score, calculate_python_solid_score
+
+    small = OOPAnalysis(total_classes=2, abstract_classes=["A"], public_methods=4, operator_overloads=1, inheritance_depth=1)
+    small.classes_with_inheritance = 1
+    assert calculate_python_oop_score(small) == 4
+    assert calculate_python_solid_score(small) == pytest.approx(4.0)
+
+    medium = OOPAnalysis(total_classes=5, abstract_classes=["A"], private_methods=2, public_methods=10, operator_overloads=2)
+    medium.inheritance_depth, medium.classes_with_inheritance, medium.properties_count = 2, 3, 2
+    assert calculate_python_oop_score(medium) == 5
+    assert calculate_python_solid_score(medium) == pytest.approx(3.7)
+
+    large = OOPAnalysis(
+        total_classes=12, abstract_classes=["A", "B"], protected_methods=30, public_methods=60, operator_overloads=10
+    )
+    large.inheritance_depth, large.classes_with_inheritance, large.properties_count = 2, 6, 3
+    large.design_patterns = ["Factory"]
+    assert calculate_python_oop_score(large) == 4
+    assert calculate_python_solid_score(large) == pytest.approx(4.0)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
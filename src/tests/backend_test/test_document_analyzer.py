@@ -0,0 +1,90 @@
+"""
+Tests for the document analyzer's citation and vocabulary counting.
+"""
+
+import re
+
+import pytest
+
+from backend.analysis.document_analyzer import (CitationDetector,
+                                               WritingMetricsCalculator,
+                                               _matches_at_least)
+
+REFERENCES = ["[1] Smith, J. Parsing.", "[2] Jones, K. Lexing.", "[3] Lee, M. Typing."]
+
+
+def count_in_last_lines(text, pattern):
+    """Count the pattern over the last 30% of lines, as the analyzer originally did."""
+    lines = text.split("\n")
+    return sum(1 for line in lines[int(len(lines) * 0.7) :] if re.match(pattern, line.strip()))
+
+
+class TestBibliographyEntries:
+    """Test counting bibliography entries in the last 30% of the document."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "\n",
+            "\n\n\n",
+            REFERENCES[0],
+            REFERENCES[0] + "\n",
+            "\n".join(REFERENCES),
+            "\n".join(REFERENCES) + "\n",
+            "\n".join(["Body text."] * 7 + REFERENCES),
+            "\n".join(["Body text."] * 7 + REFERENCES) + "\n",
+            "\n".join(REFERENCES + ["Body text."] * 7),
+            "\r\n".join(["Body text."] * 7 + REFERENCES) + "\r\n",
+        ],
+    )
+    def test_matches_original_line_split(self, text):
+        """Test that the tail covers the same lines as splitting the whole text."""
+        for style, pattern in CitationDetector.BIBLIOGRAPHY_PATTERNS.items():
+            assert CitationDetector(text)._count_bibliography_entries(style) == count_in_last_lines(text, pattern)
+
+    def test_counts_only_the_tail(self):
+        """Test that entries before the last 30% of lines are not counted."""
+        text = "\n".join(REFERENCES + ["Body text."] * 7 + REFERENCES)
+
+        assert CitationDetector(text)._count_bibliography_entries("IEEE") == 3
+
+    def test_single_line(self):
+        """Test that a one-line document is searched in full."""
+        assert CitationDetector(REFERENCES[0])._count_bibliography_entries("IEEE") == 1
+
+    def test_unknown_style(self):
+        """Test that an unknown style has no entries."""
+        assert CitationDetector("\n".join(REFERENCES))._count_bibliography_entries("Vancouver") == 0
+
+
+class TestMatchesAtLeast:
+    """Test the early-exit threshold check used by the tone scans."""
+
+    @pytest.mark.parametrize("threshold", [0, 0.0, 0.5, 1, 1.5, 2, 2.0, 2.1, 3, 2.9999])
+    @pytest.mark.parametrize("text", ["", "however", "however therefore", "however therefore however"])
+    def test_matches_full_count(self, text, threshold):
+        """Test that stopping early agrees with counting every match."""
+        pattern = re.compile(r"\b(?:however|therefore)\b")
+
+        assert _matches_at_least(pattern, text, threshold) == (len(pattern.findall(text)) >= threshold)
+
+    def test_zero_threshold_without_matches(self):
+        """Test that a zero threshold holds even when nothing matches."""
+        assert _matches_at_least(re.compile("absent"), "", 0)
+        assert _matches_at_least(re.compile("absent"), "some text", 0.0)
+
+    def test_fractional_threshold_rounds_up(self):
+        """Test that a fractional threshold needs the next whole match."""
+        pattern = re.compile("x")
+
+        assert not _matches_at_least(pattern, "xx", 2.1)
+        assert _matches_at_least(pattern, "xxx", 2.1)
+
+    def test_formal_tone_uses_the_word_rate(self):
+        """Test that the formal tone needs 3 indicators per 1000 words."""
+        filler = " ".join(["word"] * 997)
+        calculator = WritingMetricsCalculator(filler + " however therefore moreover")
+
+        assert calculator._check_formal_tone(1000)
+        assert not calculator._check_formal_tone(1001)
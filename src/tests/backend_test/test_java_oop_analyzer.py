@@ -53,6 +53,19 @@ class TestJavaOOPAnalysis:
         assert result["interface_count"] == 2
         assert result["private_methods"] == 10
 
+    def test_oop_analysis_to_dict_matches_asdict(self):
+        """Test that to_dict covers every field and copies its containers."""
+        from dataclasses import asdict
+
+        analysis = JavaOOPAnalysis(abstract_classes=["Shape"], annotations={"Override": 2}, design_patterns=["Factory"])
+        result = analysis.to_dict()
+        assert result == asdict(analysis)
+
+        result["abstract_classes"].append("Other")
+        result["annotations"]["Override"] = 0
+        assert analysis.abstract_classes == ["Shape"]
+        assert analysis.annotations == {"Override": 2}
+
 
 @pytest.mark.skipif(not JAVALANG_AVAILABLE, reason="javalang not installed")
 class TestAnalyzeJavaFile:
@@ -202,6 +215,36 @@ class Child extends Parent {
         assert "Override" in result.annotations
 
 
+@pytest.mark.skipif(not JAVALANG_AVAILABLE, reason="javalang not installed")
+def test_analyze_java_project_combines_files(tmp_path):
+    """Test that per-file results add up across a project."""
+    import zipfile
+
+    from analysis.java_oop_analyzer import analyze_java_project
+
+    zip_path = tmp_path / "airline.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr(
+            "airline/Plane.java",
+            "abstract class Plane {\n    private int seats;\n    @Deprecated\n    public void fly() {}\n}\n",
+        )
+        zf.writestr(
+            "airline/Jet.java",
+            "class Jet extends Plane {\n    @Override\n    public void fly() {}\n    @Deprecated\n    void taxi() {}\n}\n",
+        )
+        zf.writestr("airline/Broken.java", "class {")
+
+    result = analyze_java_project(zip_path, "airline")["java_oop_analysis"]
+
+    assert result["total_classes"] == 2
+    assert result["abstract_classes"] == ["Plane"]
+    assert result["public_methods"] == 2
+    assert result["package_methods"] == 1
+    assert result["private_fields"] == 1
+    assert result["classes_with_inheritance"] == 1
+    assert result["annotations"] == {"Deprecated": 2, "Override": 1}
+
+
 @pytest.mark.skipif(not JAVALANG_AVAILABLE, reason="javalang not installed")
 class TestScoringFunctions:
     """Test OOP and SOLID scoring functions."""
@@ -207,6 +207,16 @@ class TestProjectMetadata:
         metadata = extractor.extract_project_metadata("")
         assert isinstance(metadata, ProjectMetadata)
 
+    def test_metadata_keeps_classified_file_lists(self, extractor):
+        """Test that classified Python and Java files are kept for later phases but not serialized."""
+        metadata = extractor.extract_project_metadata("")
+        python_files = extractor.project_python_files[""]
+        assert len(python_files) == metadata.languages.get("python", 0)
+        assert all(f["path"].endswith((".py", ".pyw")) for f in python_files)
+        assert len(extractor.project_java_files[""]) == metadata.languages.get("java", 0)
+        assert "python_files" not in metadata.to_dict()
+        assert "java_files" not in metadata.to_dict()
+
     def test_metadata_has_required_fields(self, extractor):
         """Test that metadata contains all required fields."""
         metadata = extractor.extract_project_metadata("")
@@ -36,6 +36,16 @@ class TestFileClassifierInitialization:
             assert classifier.zip_file is not None
         # ZIP should be closed after exiting context (no exception means success)
 
+    def test_shared_zip_file_left_open(self):
+        """Test that a ZIP handle passed in is reused and not closed by the classifier."""
+        import zipfile
+
+        with zipfile.ZipFile(TEST_ZIP_PATH, "r") as zf:
+            with FileClassifier(TEST_ZIP_PATH, zip_file=zf) as classifier:
+                assert classifier.zip_file is zf
+            # Still readable after the classifier is closed
+            assert zf.namelist()
+
 
 class TestIgnorePatterns:
     """Test directory and file ignore patterns"""